@@ -3,6 +3,7 @@ import os
 import ssl
 import threading
 import tkinter as tk
+from dataclasses import replace
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
 
@@ -187,9 +188,12 @@ class MacroControllerApp:
         )
         self.window_menu.pack(side=tk.LEFT, fill="x", expand=True)
         self.window_menu.bind("<<ComboboxSelected>>", self.save_config)
+        self._window_menu_values: tuple[str, ...] = ()
         # Controls: Lock and Refresh
         self.refresh_win_button = tk.Button(
-            self.window_frame, text="Refresh", command=self.refresh_windows
+            self.window_frame,
+            text="Refresh",
+            command=lambda: self.refresh_windows(force=True),
         )
         self.refresh_win_button.pack(side=tk.RIGHT, padx=(10, 0))
         self.lock_window_button = tk.Checkbutton(
@@ -284,11 +288,15 @@ class MacroControllerApp:
         self.ws_port_entry = self.remote_view.ws_entry
         self.http_port_entry = self.remote_view.http_entry
         self.remote_status_label = self.remote_view.status_label
-        self.remote_log = self.remote_view.log
         self.ws_port_entry.bind("<FocusOut>", self.save_config)
         self.http_port_entry.bind("<FocusOut>", self.save_config)
 
     def _current_ws_port(self) -> int:
+        # A running server may have fallen back to an OS-assigned port; that
+        # port is served for this session but never written to the config
+        server = self.remote_server
+        if server is not None:
+            return server.ws_port
         try:
             return int(self.ws_port_var.get())
         except (TypeError, ValueError):
@@ -310,18 +318,19 @@ class MacroControllerApp:
             self.http_server = None
 
     def _handle_ws_port_rebind(self, port: int) -> None:
-        self.ws_port_var.set(str(port))
-        self.save_config()
+        if self.remote_server is None:
+            # Bound callback arrived after stop_remote()
+            return
+        configured = self.ws_port_var.get()
+        if str(port) != configured:
+            self.log_remote(f"WS port {configured} busy; using {port} for this session")
         self._start_http_server()
 
     def log_remote(self, message: str) -> None:
-        widget = getattr(self, "remote_log", None)
-        if not widget:
+        view = getattr(self, "remote_view", None)
+        if view is None:
             return
-        widget.configure(state=tk.NORMAL)
-        widget.insert(tk.END, f"{message}\n")
-        widget.see(tk.END)
-        widget.configure(state=tk.DISABLED)
+        view.append_log(message)
 
     def start_remote(self) -> None:
         if self.remote_server:
@@ -473,24 +482,29 @@ class MacroControllerApp:
         self.telegram.chat_id = cfg.chat_id
 
     def _capture_config_from_ui(self) -> None:
-        cfg = self.config
+        defaults = AppConfig()
         # Persist window lock settings
-        cfg.window_lock_enabled = bool(self.window_lock_var.get())
-        if cfg.window_lock_enabled:
+        lock_enabled = bool(self.window_lock_var.get())
+        cfg = replace(
+            self.config,
+            window_lock_enabled=lock_enabled,
             # Save the currently selected title as the lock target
-            cfg.window_lock_title = self.selected_window.get()
-        folder = self.macro_folder_path.get() or "No folder selected."
-        cfg.last_folder = folder
-        cfg.always_on_top = bool(self.pin_var.get())
-        cfg.bot_token = self.bot_token_var.get()
-        cfg.chat_id = self.chat_id_var.get()
-        cfg.countdown_seconds = self._coerce_positive_int(
-            self.countdown_seconds_var.get(), AppConfig().countdown_seconds
-        )
-        cfg.ws_port = self._coerce_int(self.ws_port_var.get(), AppConfig().ws_port)
-        cfg.http_port = self._coerce_int(
-            self.http_port_var.get(), AppConfig().http_port
+            window_lock_title=(
+                self.selected_window.get()
+                if lock_enabled
+                else self.config.window_lock_title
+            ),
+            last_folder=self.macro_folder_path.get() or "No folder selected.",
+            always_on_top=bool(self.pin_var.get()),
+            bot_token=self.bot_token_var.get(),
+            chat_id=self.chat_id_var.get(),
+            countdown_seconds=self._coerce_positive_int(
+                self.countdown_seconds_var.get(), defaults.countdown_seconds
+            ),
+            ws_port=self._coerce_int(self.ws_port_var.get(), defaults.ws_port),
+            http_port=self._coerce_int(self.http_port_var.get(), defaults.http_port),
         )
+        self.config = cfg
         self.telegram.bot_token = cfg.bot_token
         self.telegram.chat_id = cfg.chat_id
 
@@ -691,16 +705,25 @@ class MacroControllerApp:
         enabled = bool(self.window_lock_var.get())
         if enabled:
             # Save the current selection as the locked title
-            self.config.window_lock_enabled = True
-            self.config.window_lock_title = self.selected_window.get()
+            self.config = replace(
+                self.config,
+                window_lock_enabled=True,
+                window_lock_title=self.selected_window.get(),
+            )
         else:
-            self.config.window_lock_enabled = False
+            self.config = replace(self.config, window_lock_enabled=False)
         # Persist and re-apply in case the list should snap to the locked title
         save_app_config(self.config)
         self.refresh_windows()
 
-    def refresh_windows(self):
-        """Refresh the list of available windows using the window service."""
+    def refresh_windows(self, *, force: bool = False):
+        """Refresh the list of available windows using the window service.
+
+        Args:
+            force: Discard cached window titles first (explicit Refresh clicks).
+        """
+        if force:
+            self.context.window_service.invalidate()
         selection = self.context.window_service.build_selection(
             self.selected_window.get()
         )
@@ -708,8 +731,11 @@ class MacroControllerApp:
 
     def _apply_window_selection(self, selection: WindowSelection) -> None:
         titles = list(selection.titles)
-        display_titles = titles if titles else ["No windows found"]
-        self.window_menu["values"] = display_titles
+        display_titles = tuple(titles) if titles else ("No windows found",)
+        # Skip the Tk option round-trip when a refresh finds the same windows
+        if display_titles != self._window_menu_values:
+            self._window_menu_values = display_titles
+            self.window_menu["values"] = display_titles
 
         previous = self.selected_window.get()
         # If lock enabled and locked title is available, prefer it
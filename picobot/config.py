@@ -8,9 +8,19 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 from .settings import CONFIG_FILE
 
 logger = logging.getLogger(__name__)
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except covers both
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Resolved path -> ((mtime_ns, size), parsed config); see load_config
+_CACHE: dict[str, tuple[tuple[int, int], "AppConfig"]] = {}
 
 
 def _ensure_parent(path: Path) -> None:
@@ -28,7 +38,7 @@ def _coerce_int(value: Any, default: int) -> int:
         return default
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     # Default target window to prefer on startup/refresh when unlocked
     default_target_window: str = "Eluna (x64)"
@@ -53,11 +63,19 @@ def load_config(path: str | Path = CONFIG_FILE) -> AppConfig:
 
     defaults = AppConfig()
     cfg_path = Path(path)
-    if not cfg_path.exists():
+    try:
+        st = cfg_path.stat()
+    except OSError:
         return defaults
+    key = str(cfg_path.resolve())
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        # AppConfig is frozen, so the cached instance can be shared
+        return cached[1]
 
     try:
-        raw = json.loads(cfg_path.read_text(encoding="utf-8"))
+        raw = _json_loads(cfg_path.read_bytes())
     except json.JSONDecodeError as exc:
         logger.error("Config file %s contains invalid JSON: %s", cfg_path, exc)
         return defaults
@@ -101,7 +119,12 @@ def load_config(path: str | Path = CONFIG_FILE) -> AppConfig:
         raw.get("window_lock_title", defaults.window_lock_title)
     )
 
-    return AppConfig(**data)
+    config = AppConfig(**data)
+    _CACHE[key] = (stamp, config)
+    return config
+
+
+load_config.cache_clear = _CACHE.clear  # type: ignore[attr-defined]
 
 
 def save_config(config: AppConfig, path: str | Path = CONFIG_FILE) -> None:
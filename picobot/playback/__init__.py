@@ -1,5 +1,10 @@
 """Macro playback orchestration for PicoBot."""
 
-from .macro_controller import MacroController, build_playlist, parse_macro_file
+from .macro_controller import (
+    MacroController,
+    build_playlist,
+    parse_macro_file,
+    parse_macro_lines,
+)
 
-__all__ = ["MacroController", "build_playlist", "parse_macro_file"]
+__all__ = ["MacroController", "build_playlist", "parse_macro_file", "parse_macro_lines"]
@@ -6,7 +6,7 @@ import logging
 import os
 import random
 import time
-from typing import Callable, List, Optional
+from typing import Callable, Iterable, List, Optional
 
 import serial
 
@@ -18,34 +18,51 @@ PlaylistBuilder = Callable[[str], List[str]]
 MacroParser = Callable[[str], Optional[List[MacroEvent]]]
 
 
+def parse_macro_lines(lines: Iterable[str]) -> List[MacroEvent]:
+    """Parse ``<time> <type> <key>`` lines into timestamped HID events.
+
+    Malformed lines are skipped; a non-numeric timestamp raises ``ValueError``.
+    """
+    events: List[MacroEvent] = []
+    for line in lines:
+        parts = line.strip().split()
+        if len(parts) != 3:
+            continue
+        timestamp, event_type, key = parts
+        events.append(
+            {
+                "time": float(timestamp),
+                "type": event_type,
+                "key": key,
+            }
+        )
+    return events
+
+
 def parse_macro_file(filename: str) -> Optional[List[MacroEvent]]:
     """Parse a macro text file into timestamped HID events."""
-    events: List[MacroEvent] = []
     try:
         with open(filename, "r", encoding="utf-8") as handle:
-            for line in handle:
-                parts = line.strip().split()
-                if len(parts) != 3:
-                    continue
-                timestamp, event_type, key = parts
-                events.append(
-                    {
-                        "time": float(timestamp),
-                        "type": event_type,
-                        "key": key,
-                    }
-                )
+            return parse_macro_lines(handle)
     except Exception as exc:
         logging.warning("Could not parse macro file '%s': %s", filename, exc)
         return None
-    return events
+
+
+def _list_macros(path: str) -> List[str]:
+    """Return the entry names in *path*; split out so tests can stub the disk."""
+    return os.listdir(path)
 
 
 def build_playlist(macro_folder: str) -> List[str]:
-    """Return a randomized playlist, prioritising files prefixed with ``START_``."""
+    """Return a randomized playlist of macro file paths.
+
+    Files prefixed with ``START_`` are prioritised. Entries are full paths
+    joined onto *macro_folder* so the playback loop can open them directly.
+    """
     try:
         macro_files = [
-            name for name in os.listdir(macro_folder) if name.endswith(".txt")
+            name for name in _list_macros(macro_folder) if name.endswith(".txt")
         ]
     except FileNotFoundError as exc:
         raise FileNotFoundError("Macro folder not found") from exc
@@ -60,7 +77,7 @@ def build_playlist(macro_folder: str) -> List[str]:
 
     random.shuffle(start_files)
     random.shuffle(other_files)
-    return start_files + other_files
+    return [os.path.join(macro_folder, name) for name in start_files + other_files]
 
 
 class MacroController:
@@ -166,12 +183,11 @@ class MacroController:
                 logging.error("Error creating playlist: %s. Stopping loop.", exc)
                 break
 
-            for chosen_macro_name in current_playlist:
+            for macro_file_path in current_playlist:
                 if not self.app.is_playing:
                     break
 
-                logging.info("Playing from sequence: %s", chosen_macro_name)
-                macro_file_path = os.path.join(macro_folder, chosen_macro_name)
+                logging.info("Playing from sequence: %s", macro_file_path)
 
                 events = self.parse_macro_file(macro_file_path)
                 if events is None:
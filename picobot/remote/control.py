@@ -9,13 +9,22 @@ import os
 import queue
 import ssl
 import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable, Optional
 
 try:
     import websockets
+    from websockets import broadcast as ws_broadcast
 except Exception:
     websockets = None
+    ws_broadcast = None
+
+try:
+    import uvloop
+except Exception:
+    uvloop = None
 
 from ..transport import SerialManager
 
@@ -25,6 +34,15 @@ __all__ = [
     "RemoteControlServer",
 ]
 
+# Upper bound on fire-and-forget commands coalesced into one serial write
+_MAX_WRITE_BATCH = 32
+# Bare HID messages from the browser that need the ``hid|`` prefix
+_HID_KINDS = ("key|", "mouse|", "scroll|")
+# ``macro|<action>`` commands served by ``RemoteControlServer._macro_<action>``
+_MACRO_ACTIONS = frozenset({"start", "stop", "query"})
+# (command, wait_ack, response_queue, timeout)
+_SerialCommand = tuple[str, bool, Optional["queue.Queue[bool]"], Optional[float]]
+
 
 @dataclass
 class RemoteCallbacks:
@@ -43,7 +61,10 @@ class RemoteCallbacks:
 
 
 class AsyncWebsocketBridge:
-    """Owns the asyncio loop for the remote WebSocket interface."""
+    """Owns the asyncio loop for the remote WebSocket interface.
+
+    The loop runs until ``stop()`` even if the server fails to start.
+    """
 
     def __init__(
         self,
@@ -55,7 +76,7 @@ class AsyncWebsocketBridge:
         on_client_connected: Optional[Callable[[object], None]] = None,
         on_client_disconnected: Optional[Callable[[object], None]] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
-        max_attempts: int = 10,
+        on_loop_started: Optional[Callable[[asyncio.AbstractEventLoop], None]] = None,
         ssl_context: Optional[ssl.SSLContext] = None,
     ) -> None:
         self.host = host
@@ -65,11 +86,13 @@ class AsyncWebsocketBridge:
         self.on_client_connected = on_client_connected
         self.on_client_disconnected = on_client_disconnected
         self.on_error = on_error
-        self.max_attempts = max_attempts
+        self.on_loop_started = on_loop_started
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        self._async_stop: Optional[asyncio.Event] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._server = None
+        self._client_tasks: set[asyncio.Task] = set()
         self.port = int(port)
         self.ssl_context = ssl_context
 
@@ -87,9 +110,12 @@ class AsyncWebsocketBridge:
     def stop(self) -> None:
         self._stop_event.set()
         loop = self._loop
+        async_stop = self._async_stop
         if loop and loop.is_running():
             try:
-                loop.call_soon_threadsafe(lambda: None)
+                loop.call_soon_threadsafe(self._cancel_client_tasks)
+                if async_stop is not None:
+                    loop.call_soon_threadsafe(async_stop.set)
             except Exception:
                 pass
         if self._thread and self._thread.is_alive():
@@ -99,90 +125,129 @@ class AsyncWebsocketBridge:
         self._server = None
 
     def _run(self) -> None:
-        if websockets is None:
-            if self.on_error:
-                try:
-                    self.on_error(RuntimeError("websockets package is not available"))
-                except Exception:
-                    pass
-            return
-        loop = asyncio.new_event_loop()
+        loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
         self._loop = loop
         asyncio.set_event_loop(loop)
+        # The bridge barely uses run_in_executor(None, ...); avoid asyncio's
+        # default of up to cpu_count() + 4 idle worker threads.
+        default_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="picobot-ws"
+        )
+        loop.set_default_executor(default_executor)
         try:
-            loop.run_until_complete(self._start_server())
-            if self._server is None:
-                return
+            if self.on_loop_started:
+                # Lets the owner schedule its own tasks before the server starts
+                self.on_loop_started(loop)
+            if websockets is None:
+                self._report_error(RuntimeError("websockets package is not available"))
+            else:
+                try:
+                    loop.run_until_complete(self._start_server())
+                except Exception as exc:
+                    self._report_error(exc)
+            # Keep the loop up without a WS server so the owner's tasks still run
             loop.run_until_complete(self._wait_for_stop())
         except Exception as exc:
-            if self.on_error:
-                try:
-                    self.on_error(exc)
-                except Exception:
-                    pass
+            self._report_error(exc)
         finally:
+            try:
+                if self._client_tasks:
+                    self._cancel_client_tasks()
+                    loop.run_until_complete(
+                        asyncio.gather(*self._client_tasks, return_exceptions=True)
+                    )
+            except Exception:
+                pass
             try:
                 if self._server:
                     self._server.close()
                     loop.run_until_complete(self._server.wait_closed())
             except Exception:
                 pass
+            try:
+                leftovers = asyncio.all_tasks(loop)
+                for task in leftovers:
+                    task.cancel()
+                if leftovers:
+                    loop.run_until_complete(
+                        asyncio.gather(*leftovers, return_exceptions=True)
+                    )
+            except Exception:
+                pass
             try:
                 if loop.is_running():
                     loop.stop()
             except Exception:
                 pass
             loop.close()
+            default_executor.shutdown(wait=False)
             self._loop = None
             self._server = None
+            self._async_stop = None
 
     async def _start_server(self) -> None:
-        last_error: Optional[Exception] = None
-        for offset in range(self.max_attempts):
-            port = self.base_port + offset
+        try:
+            self._server = await self._serve(self.base_port)
+        except OSError as exc:
+            logging.getLogger(__name__).info(
+                "WS port %s unavailable (%s); letting the OS pick one",
+                self.base_port,
+                exc,
+            )
             try:
-                self._server = await websockets.serve(
-                    self._handle_client,
-                    self.host,
-                    port,
-                    ping_interval=20,
-                    ping_timeout=20,
-                    ssl=self.ssl_context,
-                    compression=None,
-                )
-                self.port = port
-                if self.on_port_bound:
-                    try:
-                        self.on_port_bound(port)
-                    except Exception:
-                        pass
+                self._server = await self._serve(0)
+            except OSError as fallback_exc:
+                self._report_error(fallback_exc)
                 return
-            except OSError as exc:
-                last_error = exc
-                await asyncio.sleep(0.3)
-        if last_error and self.on_error:
+        port = self._server.sockets[0].getsockname()[1]
+        self.port = port
+        if self.on_port_bound:
             try:
-                self.on_error(last_error)
+                self.on_port_bound(port)
             except Exception:
                 pass
+
+    async def _serve(self, port: int):
+        return await websockets.serve(
+            self._handle_client,
+            self.host,
+            port,
+            ping_interval=20,
+            ping_timeout=20,
+            ssl=self.ssl_context,
+            compression=None,
+        )
+
     async def _wait_for_stop(self) -> None:
-        while not self._stop_event.is_set():
-            await asyncio.sleep(0.1)
+        self._async_stop = asyncio.Event()
+        # stop() sets the threading event before touching _async_stop, so a
+        # stop issued before the asyncio event existed is still observed here.
+        if self._stop_event.is_set():
+            return
+        await self._async_stop.wait()
+
+    def _report_error(self, exc: Exception) -> None:
+        if self.on_error:
+            try:
+                self.on_error(exc)
+            except Exception:
+                pass
+
+    def _cancel_client_tasks(self) -> None:
+        for task in self._client_tasks:
+            task.cancel()
 
     async def _handle_client(self, websocket, path: str | None = None) -> None:
+        task = asyncio.current_task()
+        self._client_tasks.add(task)
         try:
             if self.on_client_connected:
                 try:
                     self.on_client_connected(websocket)
                 except Exception:
                     pass
-            while not self._stop_event.is_set():
-                try:
-                    message = await asyncio.wait_for(websocket.recv(), timeout=0.5)
-                except asyncio.TimeoutError:
-                    continue
-                if message is None:
-                    break
+            # Shutdown cancels this task via stop(), so recv needs no polling timeout
+            async for message in websocket:
                 try:
                     await self.message_handler(websocket, message)
                 except Exception as exc:
@@ -197,6 +262,7 @@ class AsyncWebsocketBridge:
         except getattr(websockets, "exceptions", object()).ConnectionClosedError:
             pass
         finally:
+            self._client_tasks.discard(task)
             if self.on_client_disconnected:
                 try:
                     self.on_client_disconnected(websocket)
@@ -205,7 +271,16 @@ class AsyncWebsocketBridge:
 
 
 class RemoteControlServer:
-    """Runs a WebSocket server in background threads and relays commands to Pico."""
+    """Runs a WebSocket server in background threads and relays commands to Pico.
+
+    Serial writes are driven by a coroutine on the bridge's event loop; only
+    the blocking ``send_payload`` call is handed to a single worker thread.
+    The loop keeps running when the WebSocket server cannot start, so local
+    callers such as macro playback can still reach the Pico.
+    ``enqueue_hid_payload`` returns ``False`` before ``start()`` and after
+    ``stop()``; commands sent in between, while the loop is still starting,
+    are buffered and written once it runs.
+    """
 
     def __init__(
         self,
@@ -221,17 +296,32 @@ class RemoteControlServer:
         self.callbacks = callbacks
         self.serial_manager = serial_manager or SerialManager(serial_port_name)
         self.ssl_context = ssl_context
-        self.cmd_queue: "queue.Queue[tuple[str, bool, Optional[queue.Queue[bool]], Optional[float]]]" = queue.Queue()
-        self.stop_event = threading.Event()
-        self.writer_thread: Optional[threading.Thread] = None
+        # Created for each bridge loop; items are only put from that loop's thread
+        self.cmd_queue: Optional[asyncio.Queue[_SerialCommand]] = None
+        self._cmd_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Commands enqueued between start() and the bridge loop coming up; moved
+        # into ``cmd_queue`` in order once it exists. Guarded by _queue_lock.
+        self._pending_cmds: deque[_SerialCommand] = deque()
+        self._queue_lock = threading.Lock()
+        self._serial_exec: Optional[ThreadPoolExecutor] = None
         self.bridge: Optional[AsyncWebsocketBridge] = None
         self.clients: set = set()
         self.clients_lock = threading.Lock()
+        # Immutable copy of ``clients`` rebuilt on connect/disconnect so that
+        # broadcast() can iterate it without taking the lock
+        self._clients_snapshot: tuple = ()
         self.selected_playlist: Optional[str] = None
+        self._status_connected = ""
+        self._status_listening = ""
+        self._update_status_strings(ws_port)
+        self._macro_dispatch = {
+            f"macro|{action}": getattr(self, f"_macro_{action}")
+            for action in _MACRO_ACTIONS
+        }
 
     # -- Lifecycle ---------------------------------------------------------
     def start(self) -> None:
-        if self.writer_thread and self.writer_thread.is_alive():
+        if self.bridge is not None:
             return
         try:
             self.serial_manager.open()
@@ -244,10 +334,9 @@ class RemoteControlServer:
             self._set_status("Remote: Serial error")
             return
         self.serial_manager.register_line_callback(self._on_serial_line)
-        self.stop_event.clear()
-        self.cmd_queue = queue.Queue()
-        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
-        self.writer_thread.start()
+        self._serial_exec = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="picobot-serial"
+        )
         self.bridge = AsyncWebsocketBridge(
             host="0.0.0.0",
             port=self.ws_port,
@@ -256,48 +345,96 @@ class RemoteControlServer:
             on_client_connected=self._on_ws_client_connected,
             on_client_disconnected=self._on_ws_client_disconnected,
             on_error=self._on_ws_error,
+            on_loop_started=self._on_bridge_loop_started,
             ssl_context=self.ssl_context,
         )
         self.bridge.start()
 
     def stop(self) -> None:
-        self.stop_event.set()
         if self.bridge:
             self.bridge.stop()
-        self.bridge = None
-        if self.writer_thread and self.writer_thread.is_alive():
-            self.writer_thread.join(timeout=1.5)
-        self.writer_thread = None
+        with self._queue_lock:
+            self.bridge = None
+            self.cmd_queue = None
+            self._cmd_loop = None
+            self._pending_cmds.clear()
+        if self._serial_exec is not None:
+            # Let an in-flight write finish before the port is closed below
+            self._serial_exec.shutdown(wait=True, cancel_futures=True)
+            self._serial_exec = None
         self.serial_manager.unregister_line_callback(self._on_serial_line)
         self.serial_manager.close()
         with self.clients_lock:
             self.clients.clear()
+            self._clients_snapshot = ()
 
     # -- Serial bridge -----------------------------------------------------
-    def _writer_loop(self) -> None:
-        while not self.stop_event.is_set():
-            try:
-                cmd, wait_ack, response_queue, timeout_s = self.cmd_queue.get(
-                    timeout=0.1
-                )
-            except queue.Empty:
-                continue
-            result = False
-            try:
-                self._log(f"TX: {cmd.strip()}")
-                result = self.serial_manager.send_payload(
-                    cmd,
-                    wait_ack=wait_ack,
-                    timeout=timeout_s or 1.5,
+    def _on_bridge_loop_started(self, loop: asyncio.AbstractEventLoop) -> None:
+        cmd_queue: asyncio.Queue[_SerialCommand] = asyncio.Queue()
+        with self._queue_lock:
+            while self._pending_cmds:
+                cmd_queue.put_nowait(self._pending_cmds.popleft())
+            self._cmd_loop = loop
+            self.cmd_queue = cmd_queue
+        loop.create_task(self._writer_coro(cmd_queue))
+
+    async def _writer_coro(self, cmd_queue: "asyncio.Queue[_SerialCommand]") -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item: Optional[_SerialCommand] = await cmd_queue.get()
+            # Coalesce queued fire-and-forget commands into a single write; an
+            # ack-waiting command flushes the batch and is then sent on its own.
+            batch: list[str] = []
+            while item is not None and not item[1] and item[2] is None:
+                batch.append(item[0])
+                if len(batch) == _MAX_WRITE_BATCH:
+                    # Leave the rest queued for the next batch
+                    item = None
+                    break
+                try:
+                    item = cmd_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    item = None
+            if batch:
+                await loop.run_in_executor(self._serial_exec, self._write_batch, batch)
+            if item is not None:
+                await loop.run_in_executor(
+                    self._serial_exec, self._write_command, *item
                 )
-            except Exception as exc:
-                self._log(f"ERR: serial write {exc}")
-            finally:
-                if response_queue is not None:
-                    try:
-                        response_queue.put_nowait(result)
-                    except queue.Full:
-                        pass
+
+    def _write_batch(self, cmds: list[str]) -> None:
+        if len(cmds) == 1:
+            self._log(f"TX: {cmds[0]}")
+        else:
+            self._log(f"TX x{len(cmds)}: {' ; '.join(cmds)}")
+        try:
+            self.serial_manager.send_payloads(cmds, wait_ack=False)
+        except Exception as exc:
+            self._log(f"ERR: serial write {exc}")
+
+    def _write_command(
+        self,
+        cmd: str,
+        wait_ack: bool,
+        response_queue: Optional["queue.Queue[bool]"],
+        timeout_s: Optional[float],
+    ) -> None:
+        result = False
+        try:
+            self._log(f"TX: {cmd.strip()}")
+            result = self.serial_manager.send_payload(
+                cmd,
+                wait_ack=wait_ack,
+                timeout=timeout_s or 1.5,
+            )
+        except Exception as exc:
+            self._log(f"ERR: serial write {exc}")
+        finally:
+            if response_queue is not None:
+                try:
+                    response_queue.put_nowait(result)
+                except queue.Full:
+                    pass
 
     def _on_serial_line(self, line: str) -> None:
         if line == "ACK":
@@ -317,51 +454,62 @@ class RemoteControlServer:
         message = (payload or "").strip()
         if not message:
             return False
-        if message.startswith("hid|"):
-            cmd = message
-        else:
-            parts = message.split("|")
-            if len(parts) >= 3 and parts[0] in ("key", "mouse", "scroll"):
-                cmd = f"hid|{message}"
-            else:
-                cmd = message
-        if wait_ack:
-            response_queue: "queue.Queue[bool]" = queue.Queue(maxsize=1)
-            self.cmd_queue.put((cmd, True, response_queue, timeout))
-            try:
-                return response_queue.get(timeout=timeout)
-            except queue.Empty:
+        # Anything else (including already-prefixed ``hid|...``) passes through
+        cmd = "hid|" + message if message.startswith(_HID_KINDS) else message
+        response_queue: Optional["queue.Queue[bool]"] = (
+            queue.Queue(maxsize=1) if wait_ack else None
+        )
+        item = (cmd, wait_ack, response_queue, timeout)
+        with self._queue_lock:
+            if self.bridge is None:
+                # Not started, or already stopped
                 return False
-        self.cmd_queue.put((cmd, False, None, timeout))
-        return True
+            if self.cmd_queue is None:
+                # Bridge loop not up yet; its writer picks this up on start
+                self._pending_cmds.append(item)
+            else:
+                try:
+                    self._cmd_loop.call_soon_threadsafe(
+                        self.cmd_queue.put_nowait, item
+                    )
+                except RuntimeError:
+                    # Bridge loop already closed
+                    return False
+        if response_queue is None:
+            return True
+        try:
+            return response_queue.get(timeout=timeout)
+        except queue.Empty:
+            return False
 
     def wait_for_ready(self, timeout: float = 12.0) -> bool:
         """Block until a recent PICO_READY has been seen.
 
-        Strategy: send a handshake probe immediately to prompt a READY, then
-        wait a short, capped interval (1–2s) for the response. If that fails
-        and we still have time budget, try one more quick attempt.
+        Strategy: send a handshake probe immediately to prompt a READY and
+        wait once for it, capped at 3.5s. If nothing has arrived after 2s a
+        timer pokes the Pico a second time without interrupting the wait.
         """
+        budget = min(3.5, max(0.5, timeout))
+        self._send_handshake()
+        retry = threading.Timer(2.0, self._send_handshake) if budget > 2.4 else None
+        if retry is not None:
+            retry.daemon = True
+            retry.start()
         try:
-            total_budget = max(0.5, timeout)
-            # Always poke the Pico first
-            try:
-                self.serial_manager.send_payload("hello|handshake", wait_ack=False, timeout=0.2)
-            except Exception:
-                pass
-            if self.serial_manager.wait_for_ready(timeout=min(2.0, total_budget)):
-                return True
-            # Optional second poke if budget allows
-            remaining = total_budget - min(2.0, total_budget)
-            if remaining > 0.4:
-                try:
-                    self.serial_manager.send_payload("hello|handshake", wait_ack=False, timeout=0.2)
-                except Exception:
-                    pass
-                return self.serial_manager.wait_for_ready(timeout=min(1.5, remaining))
-            return False
+            return self.serial_manager.wait_for_ready(timeout=budget)
         except Exception:
             return False
+        finally:
+            if retry is not None:
+                retry.cancel()
+
+    def _send_handshake(self) -> None:
+        try:
+            self.serial_manager.send_payload(
+                "hello|handshake", wait_ack=False, timeout=0.2
+            )
+        except Exception:
+            pass
 
     def send_hid(
         self,
@@ -436,21 +584,28 @@ class RemoteControlServer:
         msg = (message or "").strip()
         if not msg:
             return
-        with self.clients_lock:
-            for client in list(self.clients):
-                try:
-                    asyncio.run_coroutine_threadsafe(
-                        client.send(msg), self.bridge._loop
-                    )
-                except Exception:
-                    # Client may have disconnected, will be cleaned up later
-                    pass
+        loop = self.bridge._loop if self.bridge else None
+        if loop is None or ws_broadcast is None:
+            return
+        clients = self._clients_snapshot
+        if not clients:
+            return
+        try:
+            # Frames the message once and skips connections that are not open
+            loop.call_soon_threadsafe(ws_broadcast, clients, msg)
+        except RuntimeError:
+            # Loop is shutting down; clients are being closed with it
+            pass
 
     # -- WebSocket callbacks -----------------------------------------------
     async def _handle_ws_message(self, websocket, message: str) -> None:
         msg = (message or "").strip()
         if not msg:
             return
+        handler = self._macro_dispatch.get(msg)
+        if handler is not None:
+            await handler(websocket)
+            return
         # Dedicated ping/pong for client heartbeat latency checks
         if msg.startswith("ping|"):
             try:
@@ -473,47 +628,57 @@ class RemoteControlServer:
                     self._log(f"WS: macro|playlists|set received -> {playlist}")
                     self._handle_set_playlist(playlist)
                 return
+            if action in _MACRO_ACTIONS:
+                # Same command with trailing fields, e.g. "macro|start|<nonce>"
+                await self._macro_dispatch[f"macro|{action}"](websocket)
                 return
-
-            if action == "start":
-                self._log("WS: macro|start received")
-                self._schedule(self.callbacks.start_macro)
-            elif action == "stop":
-                self._log("WS: macro|stop received")
-                self._schedule(self.callbacks.stop_macro)
-            elif action == "query":
-                try:
-                    playing = bool(self.callbacks.is_macro_playing())
-                except Exception:
-                    playing = False
-                self._log(f"WS: macro|query received -> playing={playing}")
-                try:
-                    await websocket.send("macro|playing" if playing else "macro|stopped")
-                except Exception:
-                    pass
-            else:
-                self._log(f"WS: unknown macro action '{action}'")
+            self._log(f"WS: unknown macro action '{action}'")
             return
         self.enqueue_hid_payload(msg)
 
+    async def _macro_start(self, websocket) -> None:
+        self._log("WS: macro|start received")
+        self._schedule(self.callbacks.start_macro)
+
+    async def _macro_stop(self, websocket) -> None:
+        self._log("WS: macro|stop received")
+        self._schedule(self.callbacks.stop_macro)
+
+    async def _macro_query(self, websocket) -> None:
+        try:
+            playing = bool(self.callbacks.is_macro_playing())
+        except Exception:
+            playing = False
+        self._log(f"WS: macro|query received -> playing={playing}")
+        try:
+            await websocket.send("macro|playing" if playing else "macro|stopped")
+        except Exception:
+            pass
+
     def _on_ws_port_bound(self, port: int) -> None:
         self.ws_port = port
+        self._update_status_strings(port)
         self._schedule(lambda: self.callbacks.set_ws_port(port))
 
+    def _update_status_strings(self, port: int) -> None:
+        scheme = "wss" if self.ssl_context else "ws"
+        self._status_connected = f"Remote: Connected ({scheme}://0.0.0.0:{port})"
+        self._status_listening = f"Remote: Listening ({scheme}://0.0.0.0:{port})"
+
     def _on_ws_client_connected(self, websocket) -> None:
         with self.clients_lock:
             self.clients.add(websocket)
+            self._clients_snapshot = tuple(self.clients)
         peer = getattr(websocket, "remote_address", None)
         self._log(f"WS: client connected {peer}")
-        scheme = "wss" if (self.bridge and getattr(self.bridge, "ssl_context", None)) else "ws"
-        self._set_status(f"Remote: Connected ({scheme}://0.0.0.0:{self.ws_port})")
+        self._set_status(self._status_connected)
 
     def _on_ws_client_disconnected(self, websocket) -> None:
         with self.clients_lock:
             self.clients.discard(websocket)
+            self._clients_snapshot = tuple(self.clients)
         self._log("WS: client disconnected")
-        scheme = "wss" if (self.bridge and getattr(self.bridge, "ssl_context", None)) else "ws"
-        self._set_status(f"Remote: Listening ({scheme}://0.0.0.0:{self.ws_port})")
+        self._set_status(self._status_listening)
 
     def _on_ws_error(self, error: Exception) -> None:
         logging.error("WebSocket bridge error: %s", error)
@@ -4,12 +4,21 @@ from __future__ import annotations
 
 import logging
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Callable, Iterable, List
 
 __all__ = ["EmbeddedHTTPServer"]
 
+_FALLBACK_HTML_BYTES = (
+    b"<html><body style='background:#121212;color:#eee;font-family:sans-serif'>"
+    b"<h3 style='margin:16px'>index.html not found</h3>"
+    b"<p style='margin:16px'>Create <code>index.html</code> in the PicoBot folder. "
+    b"You can use the token <code>REPLACE_WS_PORT</code> and it will be replaced "
+    b"with the active WebSocket port.</p>"
+    b"</body></html>"
+)
+
 
 class EmbeddedHTTPServer:
     """Serve a simple controller page that proxies WebSocket interactions."""
@@ -23,7 +32,7 @@ class EmbeddedHTTPServer:
     ) -> None:
         self._ws_port_provider = ws_port_provider
         self.http_port = http_port
-        self.httpd: HTTPServer | None = None
+        self.httpd: ThreadingHTTPServer | None = None
         self.thread: threading.Thread | None = None
         base_dir = Path(__file__).resolve().parent
         picobot_dir = base_dir.parent
@@ -34,6 +43,8 @@ class EmbeddedHTTPServer:
             base_dir / "index.html",
         ]
         self._search_paths = list(search_paths) if search_paths else default_paths
+        # ws_port -> (source path, mtime_ns, rendered page)
+        self._cache: dict[int, tuple[Path, int, bytes]] = {}
 
     def start(self) -> None:
         if self.thread and self.thread.is_alive():
@@ -41,7 +52,7 @@ class EmbeddedHTTPServer:
         ws_port = self._resolve_ws_port()
         handler = self._build_handler(ws_port)
         try:
-            self.httpd = HTTPServer(("0.0.0.0", self.http_port), handler)
+            self.httpd = ThreadingHTTPServer(("0.0.0.0", self.http_port), handler)
             self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
             self.thread.start()
         except Exception as exc:
@@ -82,11 +93,11 @@ class EmbeddedHTTPServer:
                         self.end_headers()
                         self.wfile.write(b"Not Found")
                         return
-                    content = server._read_index(ws_port)
+                    content = server._render_index(ws_port)
                     self.send_response(200)
                     self.send_header("Content-Type", "text/html; charset=utf-8")
                     self.end_headers()
-                    self.wfile.write(content.encode("utf-8"))
+                    self.wfile.write(content)
                 except Exception:
                     pass
 
@@ -95,20 +106,21 @@ class EmbeddedHTTPServer:
 
         return Handler
 
-    def _read_index(self, ws_port: int) -> str:
-        fallback = (
-            "<html><body style='background:#121212;color:#eee;font-family:sans-serif'>"
-            "<h3 style='margin:16px'>index.html not found</h3>"
-            "<p style='margin:16px'>Create <code>index.html</code> in the PicoBot folder. "
-            "You can use the token <code>REPLACE_WS_PORT</code> and it will be replaced "
-            "with the active WebSocket port.</p>"
-            "</body></html>"
-        )
+    def _render_index(self, ws_port: int) -> bytes:
+        """Return the controller page for *ws_port*, re-reading it only when it changes."""
         for path in self._search_paths:
             try:
-                if path.exists():
-                    content = path.read_text(encoding="utf-8")
-                    return content.replace("REPLACE_WS_PORT", str(ws_port))
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                continue
+            cached = self._cache.get(ws_port)
+            if cached is not None and cached[0] == path and cached[1] == mtime_ns:
+                return cached[2]
+            try:
+                content = path.read_text(encoding="utf-8")
             except Exception:
                 continue
-        return fallback
+            rendered = content.replace("REPLACE_WS_PORT", str(ws_port)).encode("utf-8")
+            self._cache[ws_port] = (path, mtime_ns, rendered)
+            return rendered
+        return _FALLBACK_HTML_BYTES
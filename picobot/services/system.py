@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -10,6 +11,9 @@ import serial.tools.list_ports
 
 from ..transport import discover_data_port
 
+# How long WindowService reuses an enumeration of window titles
+_TITLES_TTL = 0.5
+
 
 @dataclass
 class PortSelection:
@@ -87,8 +91,23 @@ class PortService:
 class WindowService:
     """Wrap window listing and activation to ease testing."""
 
+    def __init__(self) -> None:
+        # The UI may list titles several times per user action; callers must
+        # not mutate the cached list
+        self._titles: Optional[List[str]] = None
+        self._titles_at = 0.0
+
+    def invalidate(self) -> None:
+        """Forget cached window titles so the next query re-enumerates."""
+        self._titles = None
+
     def list_titles(self) -> List[str]:
-        return [title for title in gw.getAllTitles() if title]
+        now = time.monotonic()
+        if self._titles is not None and now - self._titles_at < _TITLES_TTL:
+            return self._titles
+        self._titles = [title for title in gw.getAllTitles() if title]
+        self._titles_at = now
+        return self._titles
 
     def activate(self, title: str) -> bool:
         try:
@@ -8,16 +8,17 @@ CONFIG_FILE = "config.json"
 LOG_LEVEL = logging.INFO
 LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
 
+_CONFIGURED = False
+
 
 def configure_logging(
     *, level: int = LOG_LEVEL, fmt: str = LOG_FORMAT, force: bool = False
 ) -> None:
     """Initialize the root logger used across PicoBot."""
 
-    if force:
-        logging.basicConfig(level=level, format=fmt, force=True)
-        return
-
-    if logging.getLogger().handlers:
+    global _CONFIGURED
+    if _CONFIGURED and not force:
         return
-    logging.basicConfig(level=level, format=fmt)
+    # Without force, basicConfig leaves an already-configured root logger alone
+    logging.basicConfig(level=level, format=fmt, force=force)
+    _CONFIGURED = True
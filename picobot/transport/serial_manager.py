@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import logging
+import os
+import queue
+import re
+import sys
 import threading
 import time
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import Callable, Optional
 
 import serial
@@ -15,9 +20,53 @@ LineCallback = Callable[[str], None]
 
 HANDSHAKE_COMMAND = b"hello|handshake\n"
 _DEFAULT_BAUDRATE = 115200
+# Upper bound on a whole discovery pass, however many ports are probed
+PORT_DISCOVERY_TIMEOUT = 10.0
+_MAX_PROBE_WORKERS = 8
+_PROBE_POLL_INTERVAL = 0.005
+_READ_CHUNK = 4096
+# Drop unterminated input beyond this size rather than buffering it forever
+_MAX_PENDING = 64 * 1024
+# CircuitPython console banners/prompts; matched on raw bytes before decoding
+_CONSOLE_RE = re.compile(rb"(?i)circuitpython|repl|^>>>")
+# pyserial's POSIX read() already select()s on the port plus the pipe that
+# cancel_read() writes to, so the reader can block without a timeout there
+_BLOCKING_READS = os.name == "posix"
 _LOGGER = logging.getLogger(__name__)
 
 
+class _LineReader:
+    """Split chunked serial reads into lines instead of calling ``readline()``.
+
+    pyserial's ``readline()`` issues one ``read(1)`` per byte; reading whatever
+    is waiting in one call and splitting locally keeps syscalls per line low.
+    """
+
+    __slots__ = ("_buf",)
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def read_lines(self, ser: serial.Serial) -> list[bytes]:
+        """Read available bytes (blocking up to ``ser.timeout`` for the first)
+        and return any complete lines without their newline terminator."""
+        data = ser.read(min(_READ_CHUNK, ser.in_waiting or 1))
+        if not data:
+            return []
+        buf = self._buf
+        buf += data
+        lines: list[bytes] = []
+        while True:
+            idx = buf.find(b"\n")
+            if idx < 0:
+                break
+            lines.append(bytes(buf[:idx]))
+            del buf[: idx + 1]
+        if len(buf) > _MAX_PENDING:
+            buf.clear()
+        return lines
+
+
 def _toggle_control_lines(ser: serial.Serial) -> None:
     """Best-effort DTR/RTS toggling to coax Pico firmware into data mode."""
     try:
@@ -29,84 +78,139 @@ def _toggle_control_lines(ser: serial.Serial) -> None:
         _LOGGER.debug("Failed to toggle control lines", exc_info=True)
 
 
-def discover_data_port(
-    exclude_port: Optional[str] = None,
+def _apply_low_latency_timeouts(ser: serial.Serial) -> None:
+    """Make reads return as soon as any byte arrives instead of waiting out
+    the driver's inter-character window.
+
+    On Windows this programs COMMTIMEOUTS directly: ``ReadIntervalTimeout`` and
+    ``ReadTotalTimeoutMultiplier`` at MAXDWORD with a non-zero constant returns
+    immediately when data is buffered and otherwise blocks up to ``ser.timeout``
+    (so the reader thread does not spin). Some USB-CDC drivers misbehave with
+    these values, hence the opt-in. Other platforms need nothing: the reader
+    already sizes each read to ``in_waiting``.
+    """
+    if sys.platform != "win32":
+        return
+    try:
+        from serial import win32
+
+        maxdword = 0xFFFFFFFF
+        timeouts = win32.COMMTIMEOUTS()
+        timeouts.ReadIntervalTimeout = maxdword
+        timeouts.ReadTotalTimeoutMultiplier = maxdword
+        timeouts.ReadTotalTimeoutConstant = max(1, int((ser.timeout or 0) * 1000))
+        timeouts.WriteTotalTimeoutMultiplier = 0
+        timeouts.WriteTotalTimeoutConstant = int((ser.write_timeout or 0) * 1000)
+        if not win32.SetCommTimeouts(ser._port_handle, timeouts):
+            _LOGGER.debug("SetCommTimeouts rejected low-latency timeouts")
+    except Exception:
+        _LOGGER.debug("Failed to apply low-latency COMMTIMEOUTS", exc_info=True)
+
+
+def _probe_port(
+    port: str,
     *,
     baudrate: int = _DEFAULT_BAUDRATE,
     handshake_timeout: float = 1.0,
 ) -> Optional[str]:
-    """Probe available serial ports and return the Pico DATA CDC port if found."""
-    candidates = list(serial.tools.list_ports.comports())
-    for info in candidates:
+    """Return ``port`` if it answers the READY handshake as a Pico DATA port."""
+    try:
+        ser = serial.Serial(port, baudrate, timeout=0.5, write_timeout=0.5)
+    except Exception as exc:
+        _LOGGER.debug("Skipping port %s during discovery: %s", port, exc)
+        return None
+    try:
+        _toggle_control_lines(ser)
+        time.sleep(0.1)
+        # Ask for READY straight away rather than waiting for the periodic one
+        try:
+            ser.write(HANDSHAKE_COMMAND)
+            ser.flush()
+        except Exception:
+            _LOGGER.debug("Failed to emit handshake probe on %s", port, exc_info=True)
+        reader = _LineReader()
+        monotonic = time.monotonic
+        deadline = monotonic() + handshake_timeout
+        while monotonic() < deadline:
+            try:
+                if not ser.in_waiting:
+                    time.sleep(_PROBE_POLL_INTERVAL)
+                    continue
+                lines = reader.read_lines(ser)
+            except Exception:
+                break
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                if _CONSOLE_RE.search(line):
+                    _LOGGER.debug("Skipping console port %s", port)
+                    return None
+                if line == b"PICO_READY":
+                    _LOGGER.debug("Discovered Pico DATA port on %s", port)
+                    return port
+    finally:
+        try:
+            ser.close()
+        except Exception:
+            pass
+    return None
+
+
+def _candidate_ports(exclude_port: Optional[str]) -> list[str]:
+    """List probe-worthy devices, likely DATA interfaces (location ``x.2``) first."""
+    candidates = []
+    for info in serial.tools.list_ports.comports():
         port = getattr(info, "device", None)
         if not port or (exclude_port and port == exclude_port):
             continue
-        ser = None
-        try:
-            ser = serial.Serial(port, baudrate, timeout=0.5, write_timeout=0.5)
-        except Exception as exc:
-            _LOGGER.debug("Skipping port %s during discovery: %s", port, exc)
+        # Legacy UARTs (e.g. /dev/ttyS*) report no hardware id and are never CDC
+        if getattr(info, "hwid", None) == "n/a":
             continue
-        try:
-            _toggle_control_lines(ser)
-            time.sleep(0.1)
-            got_ready = False
-            found_console = False
-            deadline = time.time() + handshake_timeout
-            while time.time() < deadline:
-                try:
-                    line = ser.readline().decode("utf-8", errors="ignore").strip()
-                except Exception:
-                    break
-                if not line:
-                    continue
-                lower = line.lower()
-                if (
-                    ("circuitpython" in lower)
-                    or ("repl" in lower)
-                    or lower.startswith(">>>")
-                ):
-                    found_console = True
-                    break
-                if line == "PICO_READY":
-                    got_ready = True
-                    break
-            if not got_ready and not found_console:
-                try:
-                    ser.write(HANDSHAKE_COMMAND)
-                    ser.flush()
-                except Exception:
-                    _LOGGER.debug(
-                        "Failed to emit handshake probe on %s", port, exc_info=True
-                    )
-                deadline = time.time() + handshake_timeout
-                while time.time() < deadline:
-                    try:
-                        line = ser.readline().decode("utf-8", errors="ignore").strip()
-                    except Exception:
-                        break
-                    if not line:
-                        continue
-                    lower = line.lower()
-                    if (
-                        ("circuitpython" in lower)
-                        or ("repl" in lower)
-                        or lower.startswith(">>>")
-                    ):
-                        found_console = True
-                        break
-                    if line == "PICO_READY":
-                        got_ready = True
-                        break
-            if got_ready and not found_console:
-                _LOGGER.debug("Discovered Pico DATA port on %s", port)
-                return port
-        finally:
-            if ser is not None:
-                try:
-                    ser.close()
-                except Exception:
-                    pass
+        candidates.append(info)
+    candidates.sort(
+        key=lambda info: not (getattr(info, "location", "") or "").endswith("x.2")
+    )
+    return [info.device for info in candidates]
+
+
+def discover_data_port(
+    exclude_port: Optional[str] = None,
+    *,
+    baudrate: int = _DEFAULT_BAUDRATE,
+    handshake_timeout: float = 1.0,
+) -> Optional[str]:
+    """Probe available serial ports and return the Pico DATA CDC port if found.
+
+    Ports are probed concurrently; the first one to answer wins and discovery
+    as a whole gives up after ``PORT_DISCOVERY_TIMEOUT`` seconds.
+    """
+    ports = _candidate_ports(exclude_port)
+    if not ports:
+        return None
+    executor = ThreadPoolExecutor(
+        max_workers=min(_MAX_PROBE_WORKERS, len(ports)),
+        thread_name_prefix="picobot-probe",
+    )
+    futures = [
+        executor.submit(
+            _probe_port, port, baudrate=baudrate, handshake_timeout=handshake_timeout
+        )
+        for port in ports
+    ]
+    try:
+        for future in as_completed(futures, timeout=PORT_DISCOVERY_TIMEOUT):
+            try:
+                result = future.result()
+            except Exception:
+                _LOGGER.debug("Port probe failed", exc_info=True)
+                continue
+            if result:
+                return result
+    except FuturesTimeoutError:
+        _LOGGER.debug("Port discovery timed out after %.1fs", PORT_DISCOVERY_TIMEOUT)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
     return None
 
 
@@ -117,8 +221,9 @@ def finalize_handshake(ser: serial.Serial, *, wait_window: float = 0.8) -> None:
         ser.flush()
     except Exception:
         _LOGGER.debug("Failed to send handshake finalizer", exc_info=True)
-    deadline = time.time() + wait_window
-    while time.time() < deadline:
+    monotonic = time.monotonic
+    deadline = monotonic() + wait_window
+    while monotonic() < deadline:
         try:
             line = ser.readline().decode("utf-8", errors="ignore").strip()
         except Exception:
@@ -135,8 +240,9 @@ def finalize_handshake(ser: serial.Serial, *, wait_window: float = 0.8) -> None:
 
 def wait_for_ack(ser: serial.Serial, timeout: float = 1.5) -> bool:
     """Wait for an ACK line while ignoring blank lines and stray READY messages."""
-    deadline = time.time() + timeout
-    while time.time() < deadline:
+    monotonic = time.monotonic
+    deadline = monotonic() + timeout
+    while monotonic() < deadline:
         try:
             line = ser.readline().decode("utf-8", errors="ignore").strip()
         except Exception:
@@ -150,8 +256,41 @@ def wait_for_ack(ser: serial.Serial, timeout: float = 1.5) -> bool:
     return False
 
 
+class _AckWaiter(threading.Event):
+    """Event for one pending ACK; cancelled waiters are skipped on resolve."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancelled = False
+
+
 class SerialManager:
-    """Owns a persistent serial session with handshake, ACK, and READY tracking."""
+    """Owns a persistent serial session with handshake, ACK, and READY tracking.
+
+    Pass ``low_latency=True`` to tighten the port's read timeouts after opening
+    (see ``_apply_low_latency_timeouts``); this only affects Windows, where it
+    helps ACK round-trips on USB-CDC drivers, and is off by default.
+
+    On POSIX the reader thread blocks until bytes arrive and ``close()`` wakes
+    it through ``cancel_read()``; ``timeout`` only bounds reads elsewhere.
+    """
+
+    __slots__ = (
+        "port",
+        "baudrate",
+        "timeout",
+        "write_timeout",
+        "low_latency",
+        "_serial",
+        "_reader_thread",
+        "_stop_reader",
+        "_ack_waiters",
+        "_ready_event",
+        "_last_ready",
+        "_callbacks",
+        "_callbacks_lock",
+        "_write_lock",
+    )
 
     def __init__(
         self,
@@ -160,19 +299,22 @@ class SerialManager:
         baudrate: int = _DEFAULT_BAUDRATE,
         timeout: float = 0.5,
         write_timeout: float = 0.5,
+        low_latency: bool = False,
     ) -> None:
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.write_timeout = write_timeout
+        self.low_latency = low_latency
         self._serial: Optional[serial.Serial] = None
         self._reader_thread: Optional[threading.Thread] = None
         self._stop_reader = threading.Event()
-        self._ack_waiters: deque[threading.Event] = deque()
-        self._ack_lock = threading.Lock()
+        # FIFO of pending ACK waiters; SimpleQueue needs no extra Python lock
+        self._ack_waiters: queue.SimpleQueue[_AckWaiter] = queue.SimpleQueue()
         self._ready_event = threading.Event()
         self._last_ready = 0.0
-        self._callbacks: list[LineCallback] = []
+        # Copy-on-write so the reader thread can iterate without locking
+        self._callbacks: tuple[LineCallback, ...] = ()
         self._callbacks_lock = threading.Lock()
         self._write_lock = threading.Lock()
 
@@ -186,10 +328,12 @@ class SerialManager:
         ser = serial.Serial(
             self.port,
             self.baudrate,
-            timeout=self.timeout,
+            timeout=None if _BLOCKING_READS else self.timeout,
             write_timeout=self.write_timeout,
         )
         try:
+            if self.low_latency:
+                _apply_low_latency_timeouts(ser)
             _toggle_control_lines(ser)
             try:
                 ser.write(HANDSHAKE_COMMAND)
@@ -215,6 +359,12 @@ class SerialManager:
 
     def close(self) -> None:
         self._stop_reader.set()
+        if self._serial is not None:
+            # Unblock a reader parked in read() instead of waiting out its timeout
+            try:
+                self._serial.cancel_read()
+            except Exception:
+                pass
         if self._reader_thread and self._reader_thread.is_alive():
             self._reader_thread.join(timeout=1.0)
         self._reader_thread = None
@@ -224,25 +374,31 @@ class SerialManager:
             except Exception:
                 pass
         self._serial = None
-        with self._ack_lock:
-            self._ack_waiters.clear()
+        while True:
+            try:
+                self._ack_waiters.get_nowait().cancelled = True
+            except queue.Empty:
+                break
         self._ready_event.clear()
 
     def register_line_callback(self, callback: LineCallback) -> None:
-        if not callback:
+        # Validate once here so the reader never trips over a bad entry
+        if not callable(callback):
             return
         with self._callbacks_lock:
-            self._callbacks.append(callback)
+            self._callbacks = self._callbacks + (callback,)
 
     def unregister_line_callback(self, callback: LineCallback) -> None:
         with self._callbacks_lock:
+            callbacks = list(self._callbacks)
             try:
-                self._callbacks.remove(callback)
+                callbacks.remove(callback)
             except ValueError:
-                pass
+                return
+            self._callbacks = tuple(callbacks)
 
     def wait_for_ready(self, timeout: float = 12.0) -> bool:
-        if (time.time() - self._last_ready) < 1.0:
+        if (time.monotonic() - self._last_ready) < 1.0:
             return True
         if self._ready_event.wait(timeout):
             self._ready_event.clear()
@@ -252,39 +408,29 @@ class SerialManager:
     def send_payload(
         self, payload: str, *, wait_ack: bool = False, timeout: float = 1.5
     ) -> bool:
+        """Write ``payload`` on the calling thread, optionally waiting for ACK.
+
+        Writes are serialized by ``_write_lock``; there is no writer thread or
+        queue in between, so ``timeout`` bounds the only wait.
+        """
         if not payload:
             return False
-        if not self.is_open:
-            raise RuntimeError("Serial port is not open")
         cmd = payload if payload.endswith("\n") else f"{payload}\n"
-        waiter: Optional[threading.Event] = None
-        if wait_ack:
-            waiter = threading.Event()
-            with self._ack_lock:
-                self._ack_waiters.append(waiter)
-        try:
-            with self._write_lock:
-                assert self._serial is not None
-                self._serial.write(cmd.encode("utf-8"))
-                self._serial.flush()
-        except Exception:
-            if waiter is not None:
-                with self._ack_lock:
-                    try:
-                        self._ack_waiters.remove(waiter)
-                    except ValueError:
-                        pass
-            raise
-        if not wait_ack or waiter is None:
-            return True
-        if waiter.wait(timeout):
-            return True
-        with self._ack_lock:
-            try:
-                self._ack_waiters.remove(waiter)
-            except ValueError:
-                pass
-        return False
+        return self._send_bytes(cmd.encode("utf-8"), wait_ack, timeout)
+
+    def send_payloads(
+        self, payloads: list[str], *, wait_ack: bool = False, timeout: float = 1.5
+    ) -> bool:
+        """Write several payloads in one ``write()``/``flush()``.
+
+        With ``wait_ack`` one waiter is queued per payload and the call returns
+        once all of them are acknowledged or ``timeout`` expires.
+        """
+        lines = [payload.rstrip("\n") for payload in payloads if payload]
+        if not lines:
+            return False
+        data = ("\n".join(lines) + "\n").encode("utf-8")
+        return self._send_bytes(data, wait_ack, timeout, count=len(lines))
 
     def send_hid(
         self,
@@ -297,41 +443,84 @@ class SerialManager:
         base = f"{event_type}|{key}" if key else event_type
         return self.send_payload(base, wait_ack=wait_ack, timeout=timeout)
 
+    def _send_bytes(
+        self, data: bytes, wait_ack: bool, timeout: float, count: int = 1
+    ) -> bool:
+        if not self.is_open:
+            raise RuntimeError("Serial port is not open")
+        waiters: list[_AckWaiter] = []
+        if wait_ack:
+            waiters = [_AckWaiter() for _ in range(count)]
+            for waiter in waiters:
+                self._ack_waiters.put(waiter)
+        try:
+            with self._write_lock:
+                assert self._serial is not None
+                self._serial.write(data)
+                self._serial.flush()
+        except Exception:
+            for waiter in waiters:
+                waiter.cancelled = True
+            raise
+        if not waiters:
+            return True
+        # ACKs resolve in FIFO order, so the last waiter firing implies all did
+        last = waiters[-1]
+        if last.wait(timeout):
+            return True
+        for waiter in waiters:
+            waiter.cancelled = True
+        # An ACK may have landed between the timeout and the cancel
+        return last.is_set()
+
     def _resolve_next_ack(self) -> None:
-        with self._ack_lock:
-            if self._ack_waiters:
-                waiter = self._ack_waiters.popleft()
-                try:
-                    waiter.set()
-                except Exception:
-                    pass
+        while True:
+            try:
+                waiter = self._ack_waiters.get_nowait()
+            except queue.Empty:
+                return
+            if not waiter.cancelled:
+                waiter.set()
+                return
 
     def _reader_loop(self) -> None:
-        while not self._stop_reader.is_set():
+        # Bound once: this is the busiest Python loop in the transport
+        read_lines = _LineReader().read_lines
+        stopped = self._stop_reader.is_set
+        resolve_ack = self._resolve_next_ack
+        ready_set = self._ready_event.set
+        dispatch = self._dispatch_line
+        monotonic = time.monotonic
+        while not stopped():
             ser = self._serial
             if ser is None:
                 break
             try:
-                raw = ser.readline()
+                raw_lines = read_lines(ser)
             except Exception:
                 break
-            if not raw:
-                continue
-            line = raw.decode("utf-8", errors="ignore").strip()
-            if not line:
-                continue
-            if line == "ACK":
-                self._resolve_next_ack()
-            elif line == "PICO_READY":
-                self._last_ready = time.time()
-                self._ready_event.set()
-            self._dispatch_line(line)
+            for raw in raw_lines:
+                raw = raw.strip()
+                if not raw:
+                    continue
+                if raw == b"ACK":
+                    resolve_ack()
+                    text = "ACK"
+                elif raw == b"PICO_READY":
+                    self._last_ready = monotonic()
+                    ready_set()
+                    text = "PICO_READY"
+                else:
+                    text = None
+                # Only pay for decoding when someone is listening
+                if self._callbacks:
+                    if text is None:
+                        text = raw.decode("utf-8", errors="ignore")
+                    dispatch(text)
         self._stop_reader.set()
 
     def _dispatch_line(self, line: str) -> None:
-        with self._callbacks_lock:
-            callbacks = list(self._callbacks)
-        for callback in callbacks:
+        for callback in self._callbacks:
             try:
                 callback(line)
             except Exception:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
+from tkinter.scrolledtext import ScrolledText
 from typing import Callable
 
 
@@ -37,9 +38,20 @@ class PortSelectorView:
             command=on_auto_select,
         )
         self.auto_button.pack(side=tk.LEFT, padx=(5, 0))
+        self._last_ports: tuple[str, ...] = ()
 
     def set_ports(self, ports: list[str]) -> None:
-        self.combobox["values"] = ports
+        ports_t = tuple(ports)
+        # Periodic refreshes usually find the same ports; leave Tk alone then
+        if ports_t == self._last_ports:
+            return
+        self._last_ports = ports_t
+        self.combobox["values"] = ports_t
+
+
+# Toggle button appearance for each remote server state
+_RUN_CFG = {"text": "Stop Remote", "bg": "red", "fg": "white"}
+_IDLE_CFG = {"text": "Start Remote", "bg": "#1976D2", "fg": "white"}
 
 
 class RemoteView:
@@ -55,8 +67,6 @@ class RemoteView:
         on_start: Callable[[], None],
         on_stop: Callable[[], None],
     ) -> None:
-        from tkinter.scrolledtext import ScrolledText
-
         self.on_start = on_start
         self.on_stop = on_stop
         self.is_running = False
@@ -76,24 +86,26 @@ class RemoteView:
         self.http_entry = tk.Entry(self.frame, textvariable=http_port_var, width=8)
         self.http_entry.grid(row=0, column=3, sticky="w")
 
-        self.toggle_button = tk.Button(
-            self.frame,
-            text="Start Remote",
-            command=self._toggle,
-            bg="#1976D2",
-            fg="white",
-        )
+        self.toggle_button = tk.Button(self.frame, command=self._toggle, **_IDLE_CFG)
         self.toggle_button.grid(row=0, column=4, padx=(10, 0))
 
         self.status_label = tk.Label(self.frame, textvariable=status_var, anchor="w")
         self.status_label.grid(row=1, column=0, columnspan=6, sticky="ew", pady=(8, 0))
 
+        # Built up front so the app's fixed window height accounts for it
         self.log = ScrolledText(self.frame, height=5, wrap="word", state=tk.DISABLED)
         self.log.grid(row=2, column=0, columnspan=6, sticky="nsew", pady=(8, 0))
 
         self.frame.grid_columnconfigure(5, weight=1)
         self.frame.grid_rowconfigure(2, weight=1)
 
+    def append_log(self, message: str) -> None:
+        log = self.log
+        log.configure(state=tk.NORMAL)
+        log.insert(tk.END, f"{message}\n")
+        log.see(tk.END)
+        log.configure(state=tk.DISABLED)
+
     def _toggle(self):
         if self.is_running:
             self.on_stop()
@@ -101,8 +113,7 @@ class RemoteView:
             self.on_start()
 
     def set_running(self, is_running: bool) -> None:
+        if is_running == self.is_running:
+            return
         self.is_running = is_running
-        if is_running:
-            self.toggle_button.config(text="Stop Remote", bg="red", fg="white")
-        else:
-            self.toggle_button.config(text="Start Remote", bg="#1976D2", fg="white")
+        self.toggle_button.config(**(_RUN_CFG if is_running else _IDLE_CFG))
@@ -4,18 +4,28 @@ from unittest import mock
 from picobot.app import create_application
 from picobot.config import AppConfig
 
+# Built once and restarted per test; constructing a patcher re-parses the target
+_TK_PATCHER = mock.patch("picobot.app.tk.Tk")
+_LOAD_PATCHER = mock.patch("picobot.app.load_app_config")
+_APP_PATCHER = mock.patch("picobot.app.MacroControllerApp", new_callable=mock.Mock)
+
 
 class CreateApplicationTests(unittest.TestCase):
+    def _start(self, patcher):
+        mocked = patcher.start()
+        self.addCleanup(patcher.stop)
+        return mocked
+
     def test_uses_injected_dependencies(self) -> None:
         root = mock.Mock(name="root")
         cfg = AppConfig(default_target_window="Game")
         context = mock.Mock(name="context")
 
-        with mock.patch("picobot.app.MacroControllerApp", autospec=True) as factory:
-            sentinel_app = mock.Mock(name="app")
-            factory.return_value = sentinel_app
+        factory = self._start(_APP_PATCHER)
+        sentinel_app = mock.Mock(name="app")
+        factory.return_value = sentinel_app
 
-            result = create_application(root=root, config=cfg, context=context)
+        result = create_application(root=root, config=cfg, context=context)
 
         factory.assert_called_once_with(root, context=context, config=cfg)
         self.assertIs(result, sentinel_app)
@@ -24,15 +34,15 @@ class CreateApplicationTests(unittest.TestCase):
         fake_root = mock.Mock(name="tk_root")
         cfg = AppConfig(last_folder="C:/macros")
 
-        with mock.patch("picobot.app.tk.Tk", return_value=fake_root) as tk_ctor:
-            with mock.patch("picobot.app.load_app_config", return_value=cfg) as loader:
-                with mock.patch(
-                    "picobot.app.MacroControllerApp", autospec=True
-                ) as factory:
-                    sentinel_app = mock.Mock(name="app")
-                    factory.return_value = sentinel_app
+        tk_ctor = self._start(_TK_PATCHER)
+        tk_ctor.return_value = fake_root
+        loader = self._start(_LOAD_PATCHER)
+        loader.return_value = cfg
+        factory = self._start(_APP_PATCHER)
+        sentinel_app = mock.Mock(name="app")
+        factory.return_value = sentinel_app
 
-                    result = create_application()
+        result = create_application()
 
         tk_ctor.assert_called_once_with()
         loader.assert_called_once_with()
@@ -7,24 +7,35 @@ from picobot.config import AppConfig, load_config, save_config
 
 
 class ConfigTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.tmpdir = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp.cleanup()
+
+    def _config_path(self) -> Path:
+        # One file per test so tests stay independent within the shared dir
+        return self.tmpdir / f"cfg_{self._testMethodName}.json"
+
     def test_load_returns_defaults_when_missing(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "config.json"
-            cfg = load_config(path)
+        path = self._config_path()
+        cfg = load_config(path)
         self.assertEqual(cfg, AppConfig())
 
     def test_load_merges_and_coerces_values(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "config.json"
-            payload = {
-                # Deprecated key should migrate into default_target_window
-                "last_window": "Notepad",
-                "ws_port": "9000",
-                "countdown_seconds": "15",
-                "always_on_top": False,
-            }
-            path.write_text(json.dumps(payload), encoding="utf-8")
-            cfg = load_config(path)
+        path = self._config_path()
+        payload = {
+            # Deprecated key should migrate into default_target_window
+            "last_window": "Notepad",
+            "ws_port": "9000",
+            "countdown_seconds": "15",
+            "always_on_top": False,
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        cfg = load_config(path)
         self.assertEqual(cfg.default_target_window, "Notepad")
         self.assertEqual(cfg.ws_port, 9000)
         self.assertEqual(cfg.countdown_seconds, 15)
@@ -33,36 +44,44 @@ class ConfigTests(unittest.TestCase):
         self.assertEqual(cfg.http_port, AppConfig().http_port)
 
     def test_save_and_reload_roundtrip(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "config.json"
-            cfg = AppConfig(
-                default_target_window="Game",
-                last_folder="C:/macros",
-                always_on_top=False,
-                bot_token="abc",
-                chat_id="123",
-                countdown_seconds=42,
-                ws_port=9100,
-                http_port=9200,
-            )
-            save_config(cfg, path)
-            loaded = load_config(path)
+        path = self._config_path()
+        cfg = AppConfig(
+            default_target_window="Game",
+            last_folder="C:/macros",
+            always_on_top=False,
+            bot_token="abc",
+            chat_id="123",
+            countdown_seconds=42,
+            ws_port=9100,
+            http_port=9200,
+        )
+        save_config(cfg, path)
+        loaded = load_config(path)
         self.assertEqual(loaded, cfg)
 
     def test_load_tls_fields(self) -> None:
-        with tempfile.TemporaryDirectory() as tmp:
-            path = Path(tmp) / "config.json"
-            payload = {
-                "ws_tls": True,
-                "ws_certfile": "C:/certs/cert.pem",
-                "ws_keyfile": "C:/certs/key.pem",
-            }
-            path.write_text(json.dumps(payload), encoding="utf-8")
-            cfg = load_config(path)
+        path = self._config_path()
+        payload = {
+            "ws_tls": True,
+            "ws_certfile": "C:/certs/cert.pem",
+            "ws_keyfile": "C:/certs/key.pem",
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        cfg = load_config(path)
         self.assertTrue(cfg.ws_tls)
         self.assertEqual(cfg.ws_certfile, "C:/certs/cert.pem")
         self.assertEqual(cfg.ws_keyfile, "C:/certs/key.pem")
 
+    def test_load_reparses_after_file_changes(self) -> None:
+        path = self._config_path()
+        path.write_text(json.dumps({"ws_port": 9000}), encoding="utf-8")
+        self.assertEqual(load_config(path).ws_port, 9000)
+        self.assertEqual(load_config(path).ws_port, 9000)
+        path.write_text(json.dumps({"ws_port": 19001}), encoding="utf-8")
+        self.assertEqual(load_config(path).ws_port, 19001)
+        load_config.cache_clear()
+        self.assertEqual(load_config(path).ws_port, 19001)
+
 
 if __name__ == "__main__":
     unittest.main()
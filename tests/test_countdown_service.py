@@ -1,24 +1,30 @@
 import unittest
-from unittest import mock
 
+import picobot.countdown
 from picobot.countdown import CountdownService
 
 
 class CountdownServiceTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._real_sleep = picobot.countdown.time.sleep
+        picobot.countdown.time.sleep = lambda _seconds: None
+
+    def tearDown(self) -> None:
+        picobot.countdown.time.sleep = self._real_sleep
+
     def test_countdown_completes_and_reports_status(self) -> None:
         service = CountdownService()
         on_tick_calls = []
         on_status_calls = []
         on_complete_calls = []
 
-        with mock.patch("picobot.countdown.time.sleep"):
-            service.start(
-                seconds=2,
-                on_tick=on_tick_calls.append,
-                on_status=on_status_calls.append,
-                on_complete=on_complete_calls.append,
-            )
-            service.wait()
+        service.start(
+            seconds=2,
+            on_tick=on_tick_calls.append,
+            on_status=on_status_calls.append,
+            on_complete=on_complete_calls.append,
+        )
+        service.wait()
 
         self.assertEqual(on_tick_calls, [2, 1])
         self.assertEqual(on_complete_calls, [True])
@@ -36,13 +42,12 @@ class CountdownServiceTests(unittest.TestCase):
             if remaining == 1:
                 service.stop()
 
-        with mock.patch("picobot.countdown.time.sleep"):
-            service.start(
-                seconds=2,
-                on_tick=on_tick,
-                on_complete=on_complete_calls.append,
-            )
-            service.wait()
+        service.start(
+            seconds=2,
+            on_tick=on_tick,
+            on_complete=on_complete_calls.append,
+        )
+        service.wait()
 
         self.assertEqual(on_tick_calls, [2, 1])
         self.assertEqual(on_complete_calls, [False])
@@ -6,11 +6,22 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest import mock
 
+import picobot.playback.macro_controller as macro_controller_module
 from picobot.app import MacroControllerApp
-from picobot.playback import MacroController, build_playlist, parse_macro_file
+from picobot.playback import (
+    MacroController,
+    build_playlist,
+    parse_macro_file,
+    parse_macro_lines,
+)
 from picobot.remote import RemoteControlServer
 
 
+# Selections are never mutated by the controller, so one instance serves all
+_EMPTY_PORT_SEL = SimpleNamespace(ports=(), selected=None, auto_selected=False)
+_EMPTY_WIN_SEL = SimpleNamespace(titles=(), selected=None)
+
+
 class DummyPortService:
     def list_ports(self):
         return []
@@ -22,7 +33,7 @@ class DummyPortService:
         return None
 
     def build_selection(self, current=None, force_auto=False):
-        return SimpleNamespace(ports=[], selected=None, auto_selected=False)
+        return _EMPTY_PORT_SEL
 
 
 class DummyWindowService:
@@ -36,7 +47,59 @@ class DummyWindowService:
         return ""
 
     def build_selection(self, current=None):
-        return SimpleNamespace(titles=[], selected=None)
+        return _EMPTY_WIN_SEL
+
+
+class _NullVar:
+    """Stand-in for a Tk variable that ignores writes."""
+
+    __slots__ = ()
+
+    @staticmethod
+    def get() -> str:
+        return ""
+
+    @staticmethod
+    def set(_value) -> None:
+        return None
+
+
+class _NullRoot:
+    __slots__ = ()
+
+    @staticmethod
+    def after(*_args, **_kwargs) -> None:
+        return None
+
+
+class _AppStub:
+    """The slice of MacroControllerApp that MacroController touches."""
+
+    __slots__ = (
+        "is_playing",
+        "status_text",
+        "keys_currently_down",
+        "remote_server",
+        "root",
+        "port_menu",
+        "selected_port",
+        "window_menu",
+        "selected_window",
+        "log_remote",
+    )
+
+    def __init__(self) -> None:
+        null_var = _NullVar()
+        self.is_playing = True
+        self.status_text = null_var
+        self.keys_currently_down = set()
+        self.remote_server = None
+        self.root = _NullRoot()
+        self.port_menu = {}
+        self.selected_port = null_var
+        self.window_menu = {}
+        self.selected_window = null_var
+        self.log_remote = lambda *args, **kwargs: None
 
 
 class RemoteControlPlaylistTests(unittest.TestCase):
@@ -104,37 +167,31 @@ class RemoteControlPlaylistTests(unittest.TestCase):
 
 
 class MacroControllerPlaybackTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.port_service = DummyPortService()
-        self.window_service = DummyWindowService()
-        self.app_stub = SimpleNamespace(
-            is_playing=True,
-            status_text=SimpleNamespace(set=lambda value: None),
-            keys_currently_down=set(),
-            remote_server=None,
-            root=SimpleNamespace(after=lambda *_args, **_kwargs: None),
-            port_menu={},
-            selected_port=SimpleNamespace(get=lambda: "", set=lambda value: None),
-            window_menu={},
-            selected_window=SimpleNamespace(get=lambda: "", set=lambda value: None),
-            log_remote=lambda *args, **kwargs: None,
-        )
-        self.controller = MacroController(
-            self.app_stub,
-            port_service=self.port_service,
-            window_service=self.window_service,
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One controller for the class; setUp resets the state tests touch
+        cls.port_service = DummyPortService()
+        cls.window_service = DummyWindowService()
+        cls.app_stub = _AppStub()
+        cls.controller = MacroController(
+            cls.app_stub,
+            port_service=cls.port_service,
+            window_service=cls.window_service,
         )
 
-    def test_parse_macro_file_parses_events(self) -> None:
-        with tempfile.NamedTemporaryFile("w", delete=False, encoding="utf-8") as handle:
-            handle.write("0.0 down a\n0.1 up a\n")
-            path = handle.name
-        try:
-            events = parse_macro_file(path)
-        finally:
-            os.unlink(path)
-        self.assertIsNotNone(events)
-        assert events is not None
+    def setUp(self) -> None:
+        self.app_stub.is_playing = True
+        self.app_stub.keys_currently_down.clear()
+        self.app_stub.port_menu.clear()
+        self.app_stub.window_menu.clear()
+
+    def _override(self, obj, name: str, value) -> None:
+        """Shadow ``obj.name`` for this test only."""
+        setattr(obj, name, value)
+        self.addCleanup(delattr, obj, name)
+
+    def test_parse_macro_lines_parses_events(self) -> None:
+        events = parse_macro_lines(["0.0 down a\n", "0.1 up a\n", "bad line\n"])
         self.assertEqual(len(events), 2)
         self.assertEqual(events[0]["type"], "down")
         self.assertEqual(events[1]["key"], "a")
@@ -143,19 +200,24 @@ class MacroControllerPlaybackTests(unittest.TestCase):
         self.assertIsNone(parse_macro_file("nonexistent_file.txt"))
 
     def test_build_playlist_prioritises_start_files(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            for name in [
-                "START_intro.txt",
-                "macro_one.txt",
-                "START_alpha.txt",
-                "macro_two.txt",
-            ]:
-                (Path(tmpdir) / name).write_text("", encoding="utf-8")
-            with mock.patch(
-                "picobot.playback.macro_controller.random.shuffle",
-                side_effect=lambda seq: None,
-            ):
-                playlist = build_playlist(tmpdir)
+        folder = os.path.join("macros", "set")
+        listing = [
+            "START_intro.txt",
+            "macro_one.txt",
+            "notes.md",
+            "START_alpha.txt",
+            "macro_two.txt",
+        ]
+        module = macro_controller_module
+        self.addCleanup(setattr, module, "_list_macros", module._list_macros)
+        module._list_macros = lambda path: listing if path == folder else []
+        rand = module.random
+        self.addCleanup(setattr, rand, "shuffle", rand.shuffle)
+        rand.shuffle = lambda _seq: None
+
+        playlist = build_playlist(folder)
+        self.assertTrue(all(os.path.dirname(path) == folder for path in playlist))
+        playlist = [os.path.basename(path) for path in playlist]
         start_segment = playlist[:2]
         self.assertTrue(all(name.startswith("START_") for name in start_segment))
         self.assertCountEqual(start_segment, ["START_intro.txt", "START_alpha.txt"])
@@ -170,20 +232,14 @@ class MacroControllerPlaybackTests(unittest.TestCase):
         def fake_sleep(_seconds: float) -> None:
             self.app_stub.is_playing = False
 
-        with (
-            mock.patch(
-                "picobot.playback.macro_controller.time.time",
-                side_effect=fake_time,
-            ),
-            mock.patch(
-                "picobot.playback.macro_controller.time.sleep",
-                side_effect=fake_sleep,
-            ),
-            mock.patch.object(
-                self.window_service, "get_active_title", return_value="Test Window"
-            ),
-        ):
-            result = self.controller.interruptible_sleep(0.05, "Test Window")
+        clock = macro_controller_module.time
+        self.addCleanup(setattr, clock, "time", clock.time)
+        self.addCleanup(setattr, clock, "sleep", clock.sleep)
+        clock.time = fake_time
+        clock.sleep = fake_sleep
+        self._override(self.window_service, "get_active_title", lambda: "Test Window")
+
+        result = self.controller.interruptible_sleep(0.05, "Test Window")
         self.assertFalse(result)
 
     def test_build_port_selection_delegates_to_service(self) -> None:
@@ -194,7 +250,7 @@ class MacroControllerPlaybackTests(unittest.TestCase):
             self.assertTrue(force_auto)
             return expected
 
-        self.port_service.build_selection = fake_build_selection  # type: ignore[attr-defined]
+        self._override(self.port_service, "build_selection", fake_build_selection)
         result = self.controller.build_port_selection("COM3", force_auto=True)
         self.assertIs(result, expected)
 
@@ -205,7 +261,7 @@ class MacroControllerPlaybackTests(unittest.TestCase):
             self.assertEqual(current, "Two")
             return expected
 
-        self.window_service.build_selection = fake_build_selection
+        self._override(self.window_service, "build_selection", fake_build_selection)
         result = self.controller.build_window_selection("Two")
         self.assertIs(result, expected)
 
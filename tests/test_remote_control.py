@@ -0,0 +1,303 @@
+import asyncio
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from picobot.remote import control
+from picobot.remote import http as http_module
+from picobot.remote.control import RemoteCallbacks, RemoteControlServer
+from picobot.remote.http import EmbeddedHTTPServer
+
+
+class _FakeSerialManager:
+    """Records serial writes made by ``RemoteControlServer`` in call order."""
+
+    def __init__(self) -> None:
+        self.is_open = False
+        self.calls: list[tuple] = []
+        self._cond = threading.Condition()
+
+    def open(self) -> None:
+        self.is_open = True
+
+    def close(self) -> None:
+        self.is_open = False
+
+    def register_line_callback(self, callback) -> None:
+        pass
+
+    def unregister_line_callback(self, callback) -> None:
+        pass
+
+    def send_payload(self, payload, *, wait_ack=False, timeout=1.5) -> bool:
+        self._record(("payload", payload, wait_ack))
+        return True
+
+    def send_payloads(self, payloads, *, wait_ack=False, timeout=1.5) -> bool:
+        self._record(("batch", list(payloads)))
+        return True
+
+    def _record(self, call: tuple) -> None:
+        with self._cond:
+            self.calls.append(call)
+            self._cond.notify_all()
+
+    def wait_for_calls(self, count: int, timeout: float = 2.0) -> list[tuple]:
+        with self._cond:
+            self._cond.wait_for(lambda: len(self.calls) >= count, timeout)
+            return list(self.calls)
+
+
+def _callbacks(bound_ports: list[int]) -> RemoteCallbacks:
+    return RemoteCallbacks(
+        schedule=lambda func: func(),
+        log=lambda message: None,
+        set_status=lambda message: None,
+        set_ws_port=bound_ports.append,
+        start_macro=lambda: None,
+        stop_macro=lambda: None,
+        is_macro_playing=lambda: False,
+        broadcast=lambda message: None,
+        get_macro_base_path=lambda: "",
+        on_remote_playlist_selected=lambda playlist: None,
+    )
+
+
+def _wait_until(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class RemoteControlWriterTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = _FakeSerialManager()
+        self.server = RemoteControlServer(
+            "COM9", 0, _callbacks([]), serial_manager=self.manager
+        )
+        self.server._serial_exec = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(self.server._serial_exec.shutdown, wait=True)
+
+    def _run_writer(self, items, expected_calls: int) -> list[tuple]:
+        async def drive() -> None:
+            cmd_queue: asyncio.Queue = asyncio.Queue()
+            for item in items:
+                cmd_queue.put_nowait(item)
+            writer = asyncio.create_task(self.server._writer_coro(cmd_queue))
+            while len(self.manager.calls) < expected_calls:
+                await asyncio.sleep(0.001)
+            writer.cancel()
+
+        asyncio.run(asyncio.wait_for(drive(), timeout=2.0))
+        return self.manager.calls
+
+    def test_fire_and_forget_commands_share_one_write(self) -> None:
+        items = [(f"hid|key|down|{key}", False, None, 1.5) for key in "abc"]
+        calls = self._run_writer(items, expected_calls=1)
+        expected = ["hid|key|down|a", "hid|key|down|b", "hid|key|down|c"]
+        self.assertEqual(calls, [("batch", expected)])
+
+    def test_batches_are_capped(self) -> None:
+        item = ("hid|key|down|a", False, None, 1.5)
+        items = [item] * (control._MAX_WRITE_BATCH + 1)
+        calls = self._run_writer(items, expected_calls=2)
+        self.assertEqual(len(calls[0][1]), control._MAX_WRITE_BATCH)
+        self.assertEqual(calls[1], ("batch", ["hid|key|down|a"]))
+
+    def test_ack_command_keeps_its_place_between_batches(self) -> None:
+        items = [
+            ("hid|key|down|a", False, None, 1.5),
+            ("hid|key|down|b", False, None, 1.5),
+            ("hid|key|up|a", True, None, 1.5),
+            ("hid|key|up|b", False, None, 1.5),
+        ]
+        calls = self._run_writer(items, expected_calls=3)
+        self.assertEqual(
+            calls,
+            [
+                ("batch", ["hid|key|down|a", "hid|key|down|b"]),
+                ("payload", "hid|key|up|a", True),
+                ("batch", ["hid|key|up|b"]),
+            ],
+        )
+
+    def test_commands_enqueued_while_loop_starts_are_buffered(self) -> None:
+        server = self.server
+        # start() has created the bridge, but its loop is not running yet
+        server.bridge = object()
+        self.assertTrue(server.enqueue_hid_payload("key|down|a"))
+        self.assertTrue(server.enqueue_hid_payload("key|up|a"))
+
+        async def drive() -> None:
+            server._on_bridge_loop_started(asyncio.get_running_loop())
+            while not self.manager.calls:
+                await asyncio.sleep(0.001)
+
+        asyncio.run(asyncio.wait_for(drive(), timeout=2.0))
+        self.assertEqual(
+            self.manager.calls, [("batch", ["hid|key|down|a", "hid|key|up|a"])]
+        )
+
+
+class RemoteControlMacroDispatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fired: list[str] = []
+        callbacks = _callbacks([])
+        callbacks.start_macro = lambda: self.fired.append("start")
+        callbacks.stop_macro = lambda: self.fired.append("stop")
+        self.server = RemoteControlServer(
+            "COM9", 0, callbacks, serial_manager=_FakeSerialManager()
+        )
+
+    def _handle(self, message: str) -> None:
+        asyncio.run(self.server._handle_ws_message(None, message))
+
+    def test_exact_and_suffixed_commands_reach_their_callback(self) -> None:
+        self._handle("macro|start")
+        self._handle("macro|start|abc")
+        self._handle("macro|stop\n")
+        self.assertEqual(self.fired, ["start", "start", "stop"])
+
+    def test_unknown_action_fires_nothing(self) -> None:
+        self._handle("macro|rewind")
+        self.assertEqual(self.fired, [])
+
+
+class RemoteControlWithoutWebSocketTests(unittest.TestCase):
+    """Serial commands still reach the Pico when no WS server is listening."""
+
+    def setUp(self) -> None:
+        self.manager = _FakeSerialManager()
+        self.errors: list[Exception] = []
+        real_websockets = control.websockets
+        self.addCleanup(setattr, control, "websockets", real_websockets)
+
+    def _start(self) -> RemoteControlServer:
+        server = RemoteControlServer(
+            "COM9", 0, _callbacks([]), serial_manager=self.manager
+        )
+        server._on_ws_error = self.errors.append
+        self.addCleanup(server.stop)
+        server.start()
+        self.assertTrue(_wait_until(lambda: self.errors))
+        return server
+
+    def _assert_commands_are_written(self, server: RemoteControlServer) -> None:
+        self.assertTrue(server.enqueue_hid_payload("key|down|a"))
+        self.assertTrue(server.enqueue_hid_payload("key|up|a", wait_ack=True))
+        self.assertEqual(
+            self.manager.wait_for_calls(2),
+            [("batch", ["hid|key|down|a"]), ("payload", "hid|key|up|a", True)],
+        )
+        self.assertFalse(server._pending_cmds)
+
+    def test_missing_websockets_package(self) -> None:
+        control.websockets = None
+        self._assert_commands_are_written(self._start())
+
+    def test_unbindable_ws_port(self) -> None:
+        async def refuse(_bridge, _port):
+            raise OSError("address in use")
+
+        control.websockets = control.websockets or object()
+        real_serve = control.AsyncWebsocketBridge._serve
+        self.addCleanup(setattr, control.AsyncWebsocketBridge, "_serve", real_serve)
+        control.AsyncWebsocketBridge._serve = refuse
+        self._assert_commands_are_written(self._start())
+
+
+class EmbeddedHTTPServerIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.index = Path(tmp.name) / "index.html"
+        self.index.write_text("ws=REPLACE_WS_PORT", encoding="utf-8")
+        self.server = EmbeddedHTTPServer(lambda: 8765, 0, search_paths=[self.index])
+
+    def test_port_is_substituted_per_caller(self) -> None:
+        self.assertEqual(self.server._render_index(8765), b"ws=8765")
+        self.assertEqual(self.server._render_index(9000), b"ws=9000")
+        self.assertEqual(self.server._render_index(8765), b"ws=8765")
+
+    def test_page_is_rerendered_after_the_file_changes(self) -> None:
+        self.assertEqual(self.server._render_index(8765), b"ws=8765")
+        self.index.write_text("port REPLACE_WS_PORT", encoding="utf-8")
+        # Coarse filesystem clocks may not move the mtime on their own
+        mtime_ns = self.index.stat().st_mtime_ns + 1_000_000_000
+        os.utime(self.index, ns=(mtime_ns, mtime_ns))
+        self.assertEqual(self.server._render_index(8765), b"port 8765")
+
+    def test_fallback_page_is_served_once_the_file_is_gone(self) -> None:
+        self.server._render_index(8765)
+        self.index.unlink()
+        self.assertEqual(
+            self.server._render_index(8765), http_module._FALLBACK_HTML_BYTES
+        )
+
+
+class RemoteControlLifecycleTests(unittest.TestCase):
+    def setUp(self) -> None:
+        if control.websockets is None:
+            self.skipTest("websockets is not installed")
+        self.manager = _FakeSerialManager()
+        self.bound_ports: list[int] = []
+
+    def _server(self, ws_port: int) -> RemoteControlServer:
+        return RemoteControlServer(
+            "COM9", ws_port, _callbacks(self.bound_ports), serial_manager=self.manager
+        )
+
+    def _start(self, ws_port: int) -> RemoteControlServer:
+        server = self._server(ws_port)
+        self.addCleanup(server.stop)
+        server.start()
+        self.assertTrue(_wait_until(lambda: self.bound_ports))
+        return server
+
+    def test_enqueue_before_start_and_after_stop_is_rejected(self) -> None:
+        self.assertFalse(self._server(0).enqueue_hid_payload("key|down|a"))
+
+        server = self._start(0)
+        self.assertTrue(server.enqueue_hid_payload("key|down|a"))
+        self.assertEqual(
+            self.manager.wait_for_calls(1), [("batch", ["hid|key|down|a"])]
+        )
+
+        server.stop()
+        self.assertFalse(server.enqueue_hid_payload("key|down|b"))
+        self.assertEqual(len(self.manager.calls), 1)
+
+    def test_broadcast_reaches_connected_clients(self) -> None:
+        from websockets.sync.client import connect
+
+        self._server(0).broadcast("macro|stopped")  # not started: no-op
+        server = self._start(0)
+        with connect(f"ws://127.0.0.1:{self.bound_ports[0]}") as client:
+            self.assertTrue(_wait_until(lambda: server._clients_snapshot))
+            server.broadcast("macro|stopped\n")
+            self.assertEqual(client.recv(timeout=2.0), "macro|stopped")
+
+    def test_busy_port_falls_back_to_an_os_assigned_one(self) -> None:
+        busy = socket.socket()
+        self.addCleanup(busy.close)
+        busy.bind(("0.0.0.0", 0))
+        busy.listen()
+        busy_port = busy.getsockname()[1]
+
+        server = self._start(busy_port)
+
+        self.assertEqual(len(self.bound_ports), 1)
+        self.assertNotEqual(self.bound_ports[0], busy_port)
+        self.assertEqual(server.ws_port, self.bound_ports[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
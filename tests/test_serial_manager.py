@@ -1,96 +1,176 @@
-import itertools
-import threading
 import unittest
 from types import SimpleNamespace
-from unittest import mock
 
 import picobot.transport.serial_manager as serial_manager
 
 
+class _FakeSerial:
+    """Just enough of ``serial.Serial`` for the transport helpers.
+
+    ``lines`` feeds ``readline()`` and ``chunks`` feeds ``read()``; both return
+    ``b""`` once exhausted, like a port that timed out. ``on_write`` runs after
+    each write, e.g. to answer with an ACK synchronously.
+    """
+
+    __slots__ = (
+        "is_open",
+        "dtr",
+        "rts",
+        "in_waiting",
+        "_lines",
+        "_chunks",
+        "read_sizes",
+        "writes",
+        "flushes",
+        "resets",
+        "on_write",
+    )
+
+    def __init__(
+        self, lines=(), chunks=(), in_waiting: int = 0, on_write=None
+    ) -> None:
+        self.is_open = True
+        self.dtr = True
+        self.rts = False
+        self.in_waiting = in_waiting
+        self._lines = iter(lines)
+        self._chunks = iter(chunks)
+        self.read_sizes: list[int] = []
+        self.writes: list[bytes] = []
+        self.flushes = 0
+        self.resets = 0
+        self.on_write = on_write
+
+    def readline(self) -> bytes:
+        return next(self._lines, b"")
+
+    def read(self, size: int = 1) -> bytes:
+        self.read_sizes.append(size)
+        return next(self._chunks, b"")
+
+    def write(self, data: bytes) -> int:
+        self.writes.append(data)
+        if self.on_write is not None:
+            self.on_write()
+        return len(data)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+    def reset_input_buffer(self) -> None:
+        self.resets += 1
+
+    def close(self) -> None:
+        self.is_open = False
+
+
+# COM1 is the CircuitPython console, COM2 the DATA port
+_PROBE_PORTS = (SimpleNamespace(device="COM1"), SimpleNamespace(device="COM2"))
+_PROBE_REPLIES = {"COM1": b">>>\n", "COM2": b"PICO_READY\n"}
+
+
+def _fake_clock(values: list[float]):
+    """Return a clock yielding *values* in order, then repeating the last one."""
+    it = iter(values)
+    last = values[-1]
+    return lambda: next(it, last)
+
+
 class SerialManagerHelpersTests(unittest.TestCase):
+    def _setattr(self, obj, name: str, value) -> None:
+        """Set ``obj.name`` for the current test and restore it afterwards."""
+        self.addCleanup(setattr, obj, name, getattr(obj, name))
+        setattr(obj, name, value)
+
+    def _install_clock(self, values: list[float]) -> None:
+        self._setattr(serial_manager.time, "monotonic", _fake_clock(values))
+
     def test_finalize_handshake_sends_probe_and_clears_buffer(self) -> None:
-        ser = mock.Mock()
-        ser.readline.side_effect = [b"", b"PICO_READY\n", b""]
-        ser.reset_input_buffer = mock.Mock()
-        time_values = itertools.chain([0.0, 0.0, 0.2, 0.4, 0.6], itertools.repeat(1.0))
-        with mock.patch(
-            "picobot.transport.serial_manager.time.time",
-            side_effect=lambda: next(time_values),
-        ):
-            serial_manager.finalize_handshake(ser)
-        ser.write.assert_called_with(serial_manager.HANDSHAKE_COMMAND)
-        ser.flush.assert_called()
-        ser.reset_input_buffer.assert_called_once()
+        ser = _FakeSerial(lines=[b"", b"PICO_READY\n", b""])
+        self._install_clock([0.0, 0.0, 0.2, 0.4, 0.6, 1.0])
+        serial_manager.finalize_handshake(ser)
+        self.assertEqual(ser.writes, [serial_manager.HANDSHAKE_COMMAND])
+        self.assertGreaterEqual(ser.flushes, 1)
+        self.assertEqual(ser.resets, 1)
 
     def test_wait_for_ack_returns_true_on_ack(self) -> None:
-        ser = mock.Mock()
-        ser.readline.side_effect = [b"", b"ACK\n"]
-        time_values = itertools.chain([0.0, 0.0, 0.2], itertools.repeat(1.0))
-        with mock.patch(
-            "picobot.transport.serial_manager.time.time",
-            side_effect=lambda: next(time_values),
-        ):
-            self.assertTrue(serial_manager.wait_for_ack(ser, timeout=1.0))
+        ser = _FakeSerial(lines=[b"", b"ACK\n"])
+        self._install_clock([0.0, 0.0, 0.2, 1.0])
+        self.assertTrue(serial_manager.wait_for_ack(ser, timeout=1.0))
 
     def test_wait_for_ack_times_out_without_ack(self) -> None:
-        ser = mock.Mock()
-        ser.readline.side_effect = [b"", b"", b""]
-        time_values = itertools.chain([0.0, 0.0, 0.6, 1.2, 1.8], itertools.repeat(2.0))
-        with mock.patch(
-            "picobot.transport.serial_manager.time.time",
-            side_effect=lambda: next(time_values),
-        ):
-            self.assertFalse(serial_manager.wait_for_ack(ser, timeout=1.0))
-
-    @mock.patch("picobot.transport.serial_manager.time.sleep", return_value=None)
-    @mock.patch("picobot.transport.serial_manager.serial.Serial")
-    @mock.patch("picobot.transport.serial_manager.serial.tools.list_ports.comports")
-    def test_discover_data_port_prefers_ready_port(
-        self, mock_comports, mock_serial, _sleep
-    ) -> None:
-        mock_comports.return_value = [
-            SimpleNamespace(device="COM1"),
-            SimpleNamespace(device="COM2"),
-        ]
+        ser = _FakeSerial(lines=[b"", b"", b""])
+        self._install_clock([0.0, 0.0, 0.6, 1.2, 1.8, 2.0])
+        self.assertFalse(serial_manager.wait_for_ack(ser, timeout=1.0))
+
+    def test_discover_data_port_prefers_ready_port(self) -> None:
+        opened: list[str] = []
 
         def serial_factory(port, *args, **kwargs):
-            ser = mock.Mock()
-            ser.dtr = True
-            ser.rts = False
-            ser.flush = mock.Mock()
-            if port == "COM1":
-                ser.readline.side_effect = [b">>>\n", b"", b""]
-            else:
-                ser.readline.side_effect = [b"PICO_READY\n", b"", b""]
-            return ser
-
-        mock_serial.side_effect = serial_factory
+            opened.append(port)
+            reply = _PROBE_REPLIES[port]
+            return _FakeSerial(chunks=[reply], in_waiting=len(reply))
 
+        self._setattr(serial_manager.time, "sleep", lambda _seconds: None)
+        self._setattr(serial_manager.serial, "Serial", serial_factory)
+        self._setattr(
+            serial_manager.serial.tools.list_ports, "comports", lambda: _PROBE_PORTS
+        )
         result = serial_manager.discover_data_port()
         self.assertEqual(result, "COM2")
-        self.assertGreaterEqual(mock_serial.call_count, 2)
+        self.assertCountEqual(opened, ["COM1", "COM2"])
+
+    def test_candidate_ports_prefers_data_interface(self) -> None:
+        ports = [
+            SimpleNamespace(device="/dev/ttyS0", hwid="n/a"),
+            SimpleNamespace(device="COM3", location="1-1:x.0"),
+            SimpleNamespace(device="COM4", location="1-1:x.2"),
+            SimpleNamespace(device="COM5"),
+        ]
+        self._setattr(serial_manager.serial.tools.list_ports, "comports", lambda: ports)
+        self.assertEqual(serial_manager._candidate_ports("COM5"), ["COM4", "COM3"])
+
+    def test_line_reader_splits_chunked_reads(self) -> None:
+        ser = _FakeSerial(chunks=[b"ACK\r\nPICO", b"_READY\n"], in_waiting=8)
+        reader = serial_manager._LineReader()
+        self.assertEqual(reader.read_lines(ser), [b"ACK\r"])
+        self.assertEqual(reader.read_lines(ser), [b"PICO_READY"])
+        self.assertEqual(reader.read_lines(ser), [])
+        self.assertEqual(ser.read_sizes, [8, 8, 8])
 
     def test_send_payload_waits_for_ack(self) -> None:
         manager = serial_manager.SerialManager("COM9")
-        mock_serial = mock.Mock()
-        mock_serial.is_open = True
-        manager._serial = mock_serial
+        fake_serial = _FakeSerial(on_write=manager._resolve_next_ack)
+        manager._serial = fake_serial
+        self.assertTrue(
+            manager.send_payload("hid|key|down|w", wait_ack=True, timeout=0.5)
+        )
+        self.assertEqual(fake_serial.writes, [b"hid|key|down|w\n"])
+
+    def test_resolve_next_ack_skips_cancelled_waiters(self) -> None:
+        manager = serial_manager.SerialManager("COM9")
+        stale = serial_manager._AckWaiter()
+        stale.cancelled = True
+        live = serial_manager._AckWaiter()
+        manager._ack_waiters.put(stale)
+        manager._ack_waiters.put(live)
+        manager._resolve_next_ack()
+        self.assertFalse(stale.is_set())
+        self.assertTrue(live.is_set())
 
-        def resolve_ack() -> None:
+    def test_send_payloads_single_write_waits_for_every_ack(self) -> None:
+        manager = serial_manager.SerialManager("COM9")
+
+        def resolve_acks() -> None:
+            manager._resolve_next_ack()
             manager._resolve_next_ack()
 
-        ack_thread = threading.Timer(0.01, resolve_ack)
-        ack_thread.start()
-        try:
-            self.assertTrue(
-                manager.send_payload("hid|key|down|w", wait_ack=True, timeout=0.5)
-            )
-        finally:
-            ack_thread.cancel()
-
-        mock_serial.write.assert_called()
-        args, _ = mock_serial.write.call_args
-        self.assertTrue(args[0].endswith(b"\n"))
+        fake_serial = _FakeSerial(on_write=resolve_acks)
+        manager._serial = fake_serial
+        self.assertTrue(
+            manager.send_payloads(["key|down|a", "key|up|a"], wait_ack=True)
+        )
+        self.assertEqual(fake_serial.writes, [b"key|down|a\nkey|up|a\n"])
 
 
 if __name__ == "__main__":
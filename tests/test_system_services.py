@@ -0,0 +1,49 @@
+import unittest
+from types import SimpleNamespace
+
+import picobot.services.system as system_module
+from picobot.services.system import WindowService
+
+
+class WindowServiceTitleCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._real_gw = system_module.gw
+        self._real_time = system_module.time
+        self.now = 100.0
+        self.calls = 0
+
+        def get_all_titles():
+            self.calls += 1
+            return ["Game", "", "Editor"]
+
+        system_module.gw = SimpleNamespace(getAllTitles=get_all_titles)
+        system_module.time = SimpleNamespace(monotonic=lambda: self.now)
+
+    def tearDown(self) -> None:
+        system_module.gw = self._real_gw
+        system_module.time = self._real_time
+
+    def test_titles_are_reused_until_ttl_expires(self) -> None:
+        service = WindowService()
+
+        self.assertEqual(service.list_titles(), ["Game", "Editor"])
+        self.now += system_module._TITLES_TTL / 2
+        self.assertEqual(service.list_titles(), ["Game", "Editor"])
+        self.assertEqual(self.calls, 1)
+
+        self.now += system_module._TITLES_TTL
+        service.list_titles()
+        self.assertEqual(self.calls, 2)
+
+    def test_invalidate_forces_reenumeration(self) -> None:
+        service = WindowService()
+
+        service.list_titles()
+        service.invalidate()
+        service.list_titles()
+
+        self.assertEqual(self.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()